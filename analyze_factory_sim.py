@@ -4,36 +4,348 @@ Ultra-Realistic Factory Simulation Analysis Dashboard
 Provides comprehensive visualization even for failed/incomplete simulations
 """
 
+import argparse
 import json
+import os
+import sys
+import matplotlib
+
+# Use the non-interactive Agg backend when plt.show() has no display to reach
+if (not os.environ.get('MPLBACKEND') and sys.platform.startswith('linux')
+        and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.gridspec as gridspec
 from matplotlib.patches import Rectangle
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import numpy as np
 
+# Optional fast JSON parsers - fall back to the stdlib when unavailable
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError; ijson has its own
+_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError) if IJSON_AVAILABLE else (json.JSONDecodeError,)
+
+# Logs larger than this are stream-parsed instead of read into memory at once
+STREAM_PARSE_THRESHOLD_MB = 200
+
+# Production timeline categories, checked in order (anything unmatched is a Component)
+TIMELINE_CATEGORY_RULES = (
+    ('Raw Materials', ('_ore',)),
+    ('Chemicals', ('acid', 'chemical', 'solvent')),
+    ('Refined', ('steel', 'wire', 'sheet')),
+    ('Modules', ('_module',)),
+    ('Software', ('program', 'firmware', 'model')),
+)
+
+def _parse_log_stream(log_file):
+    """Stream-parse a large log file one top-level key at a time"""
+    data = {}
+    try:
+        with open(log_file, 'rb') as f:
+            for key, value in ijson.kvitems(f, '', use_float=True):
+                data[key] = value
+    except ijson.JSONError:
+        # json.dump may emit NaN/Infinity, which only the stdlib accepts
+        with open(log_file, 'r') as f:
+            return json.load(f)
+    return data
+
 def load_simulation_data(log_file="factory_simulation_log.json"):
     """Load and validate simulation data"""
     try:
+        size_mb = os.path.getsize(log_file) / (1024 * 1024)
+        if IJSON_AVAILABLE and size_mb > STREAM_PARSE_THRESHOLD_MB:
+            return _parse_log_stream(log_file)
+        if ORJSON_AVAILABLE:
+            with open(log_file, 'rb') as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # json.dump may emit NaN/Infinity, which only the stdlib accepts
+                return json.loads(raw)
         with open(log_file, 'r') as f:
             data = json.load(f)
         return data
     except FileNotFoundError:
         print(f"❌ Log file '{log_file}' not found. Please run simulation first.")
         return None
-    except json.JSONDecodeError:
+    except _PARSE_ERRORS:
         print(f"❌ Error parsing '{log_file}'. File may be corrupted.")
         return None
 
-def create_ultra_dashboard(data):
+@dataclass
+class LogIndex:
+    """Per-panel aggregates collected from log_entries in a single pass"""
+    blocking_counts: Counter = field(default_factory=Counter)
+    bottleneck_counts: Counter = field(default_factory=Counter)
+    transport_events: dict = field(default_factory=lambda: {'scheduled': 0, 'completed': 0, 'agv_busy': 0})
+    failed_modules: set = field(default_factory=set)
+    critical_events: list = field(default_factory=list)
+    top_resources: list = field(default_factory=list)
+
+# Category labels indexed by the codes returned from _classify_message (0 = no match)
+BLOCKING_LABELS = (None, 'Energy', 'Module\nUnavailable', 'Missing\nResources',
+                   'Dependencies', 'Thermal', 'Storage', 'Other')
+BOTTLENECK_LABELS = (None, 'Mining Module', 'Energy', 'Module Availability')
+TRANSPORT_KEYS = (None, 'scheduled', 'completed', 'agv_busy')
+CRITICAL_EVENTS = (None, 'FAILURE', 'BLOCK-MINING', 'BLOCK-ENERGY', 'BLOCK-MODULE')
+CRITICAL_DESCRIPTIONS = (None, None, 'Mining unavailable', 'Energy shortage', 'Module unavailable')
+CRITICAL_FAILURE = 1
+
+def _classify_message(msg):
+    """Return (blocking, bottleneck, transport, critical) category codes for one message"""
+    lo = msg.lower()
+
+    # Failure cascade ('FAILED' and 'blocked' are matched case-sensitively)
+    failed = 'FAILED' in msg
+    critical = 1 if failed else 0
+
+    # Blocking reasons, main bottleneck and blocked cascade events share one
+    # set of token tests so each substring is searched at most once
+    blocking = 0
+    bottleneck = 0
+    if 'blocked' in lo:
+        energy = 'energy' in lo
+        mining = 'mining' in lo
+        module = 'module' in lo
+
+        if energy:
+            blocking = 1
+        elif module or 'no ' in lo:
+            blocking = 2
+        elif 'resource' in lo or 'needs' in lo:
+            blocking = 3
+        elif 'dependencies' in lo:
+            blocking = 4
+        elif 'thermal' in lo:
+            blocking = 5
+        elif 'storage' in lo:
+            blocking = 6
+        else:
+            blocking = 7
+
+        if mining:
+            bottleneck = 1
+        elif energy:
+            bottleneck = 2
+        elif module:
+            bottleneck = 3
+
+        # BLOCK-MINING/ENERGY/MODULE follow the same precedence as the bottleneck
+        if not failed and bottleneck and 'blocked' in msg:
+            critical = bottleneck + 1
+
+    # Transport events
+    transport = 0
+    if 'transport' in lo:
+        if 'scheduled' in lo:
+            transport = 1
+        elif 'completed' in lo:
+            transport = 2
+        elif 'agv' in lo and 'busy' in lo:
+            transport = 3
+
+    return blocking, bottleneck, transport, critical
+
+def build_log_index(log_entries, module_names=()):
+    """Scan log_entries once and bucket every message for all dashboard panels"""
+    index = LogIndex()
+    blocking_counts = index.blocking_counts
+    bottleneck_counts = index.bottleneck_counts
+    transport_events = index.transport_events
+    failed_modules = index.failed_modules
+    critical_events = index.critical_events
+
+    for entry in log_entries:
+        msg = entry.get('message', '')
+        blocking, bottleneck, transport, critical = _classify_message(msg)
+        if blocking:
+            blocking_counts[BLOCKING_LABELS[blocking]] += 1
+        if bottleneck:
+            bottleneck_counts[BOTTLENECK_LABELS[bottleneck]] += 1
+        if transport:
+            transport_events[TRANSPORT_KEYS[transport]] += 1
+        if not critical:
+            continue
+
+        # Failures are always recorded, blocked events only until 20 critical events exist
+        time = entry.get('timestamp', 0) / 24  # Convert to days
+        if critical == CRITICAL_FAILURE:
+            # A module failed if its name appears in any FAILED message
+            lo = msg.lower()
+            failed_modules.update(module for module in module_names if module in lo)
+            critical_events.append((CRITICAL_EVENTS[critical], time, msg[:50]))
+        elif len(critical_events) < 20:
+            critical_events.append((CRITICAL_EVENTS[critical], time, CRITICAL_DESCRIPTIONS[critical]))
+
+    return index
+
+def compute_top_resources(completed_tasks, top_n=15):
+    """Total produced quantity per output and return the top_n (name, quantity) pairs"""
+    outputs = np.array([t.get('output', 'unknown') for t in completed_tasks], dtype=str)
+    qty = np.array([t.get('actual_output', t.get('quantity', 0)) for t in completed_tasks], dtype=np.float64)
+    uniq, first_seen, inverse = np.unique(outputs, return_index=True, return_inverse=True)
+    totals = np.zeros(uniq.size)
+    np.add.at(totals, inverse, qty)
+
+    # Only outputs tied with or above the top_n-th total can make the cut, so
+    # partition instead of sorting everything
+    candidates = np.arange(uniq.size)
+    if uniq.size > top_n > 0:
+        cutoff = np.partition(totals, -top_n)[-top_n]
+        candidates = np.flatnonzero(totals >= cutoff)
+
+    # Sort by quantity, ties broken by first appearance
+    order = candidates[np.lexsort((first_seen[candidates], -totals[candidates]))][:top_n]
+    return [(str(uniq[i]), float(totals[i])) for i in order]
+
+def build_dashboard_index(data):
+    """Build the LogIndex plus resource totals for a loaded simulation log"""
+    final_status = data.get("final_status", {})
+    index = build_log_index(data.get("log_entries", []), final_status.get('modules', {}).keys())
+    index.top_resources = compute_top_resources(data.get("completed_tasks", []))
+    return index
+
+# Bump whenever the classifier rules or LogIndex layout change so older
+# sidecar caches are rebuilt instead of served stale
+INDEX_FORMAT_VERSION = 2
+
+def _index_to_json(index):
+    """Convert a LogIndex into plain JSON types, keeping counter order"""
+    return {
+        'blocking_counts': list(index.blocking_counts.items()),
+        'bottleneck_counts': list(index.bottleneck_counts.items()),
+        'transport_events': index.transport_events,
+        'failed_modules': sorted(index.failed_modules),
+        'critical_events': index.critical_events,
+        'top_resources': index.top_resources,
+    }
+
+def _index_from_json(raw):
+    """Rebuild a LogIndex from the output of _index_to_json"""
+    return LogIndex(
+        blocking_counts=Counter(dict(raw['blocking_counts'])),
+        bottleneck_counts=Counter(dict(raw['bottleneck_counts'])),
+        transport_events=raw['transport_events'],
+        failed_modules=set(raw['failed_modules']),
+        critical_events=[tuple(event) for event in raw['critical_events']],
+        top_resources=[tuple(resource) for resource in raw['top_resources']],
+    )
+
+def get_or_build_index(log_path, data):
+    """Reuse the index cached next to log_path if the log is unchanged, else rebuild it
+
+    The cache is plain JSON keyed by INDEX_FORMAT_VERSION and the log's mtime
+    and size. A hit only skips building the index; the log itself is still
+    parsed because the other panels read it directly.
+    """
+    cache_path = os.path.splitext(log_path)[0] + '.index.json'
+    stat = os.stat(log_path)
+    cache_key = [INDEX_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('key') == cache_key:
+            return _index_from_json(cached['index'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    index = build_dashboard_index(data)
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({'key': cache_key, 'index': _index_to_json(index)}, f)
+    except OSError as e:
+        print(f"⚠️  Could not write index cache '{cache_path}': {e}")
+    return index
+
+def create_ultra_dashboard(data, index=None, parallel=False):
     """Create comprehensive dashboard with useful insights even for failed simulations"""
+    # Nothing was logged or produced, so every panel would only say so
+    if not data.get("log_entries") and not data.get("completed_tasks"):
+        return _empty_dashboard()
+    if parallel:
+        return _render_dashboard_parallel(data, index)
+    fig, _, _ = _build_dashboard(data, index)
+    return fig
+
+def _empty_dashboard():
+    """Single-panel figure for a simulation that produced no log entries or tasks"""
+    fig, ax = plt.subplots(figsize=(8, 4))
+    fig.suptitle("Ultra-Realistic Factory Analysis Dashboard", fontsize=14, fontweight='bold')
+    ax.text(0.5, 0.5, 'Simulation produced no data', ha='center', va='center', fontsize=12)
+    ax.axis('off')
+    return fig
+
+# Panel name -> GridSpec slot in the 4x3 dashboard layout
+PANEL_SLOTS = {
+    'inventory': (0, 0), 'health': (0, 1), 'blocking': (0, 2),
+    'energy': (1, 0), 'transport': (1, 1), 'software': (1, 2),
+    'timeline': (2, 0), 'waste': (2, 1), 'cascade': (2, 2),
+    'summary': (3, slice(None)),
+}
+
+def render_panel(job):
+    """Render one panel into its own Agg figure and return (name, RGBA pixel array)"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    name, data, index, figsize, dpi = job
+    fig = Figure(figsize=figsize, dpi=dpi, layout='constrained')
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    _replot_panel(name, ax, data, index)
+    canvas.draw()
+    return name, np.asarray(canvas.buffer_rgba()).copy()
+
+def _render_dashboard_parallel(data, index=None, max_workers=6, dpi=150):
+    """Render panels in worker processes and composite the images into one figure"""
+    if index is None:
+        index = build_dashboard_index(data)
+
+    # Panels read the log through the index, so workers don't need the raw entries
+    panel_data = {key: value for key, value in data.items() if key != 'log_entries'}
 
-    # Create figure with custom layout - 12 panels for comprehensive analysis
     fig = plt.figure(figsize=(24, 16))
     fig.suptitle("Ultra-Realistic Factory Analysis Dashboard", fontsize=20, fontweight='bold')
+    gs = gridspec.GridSpec(4, 3, figure=fig, hspace=0.05, wspace=0.05)
+
+    jobs = [(name, panel_data, index, (24 if name == 'summary' else 8, 4), dpi) for name in PANEL_SLOTS]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        images = dict(executor.map(render_panel, jobs, chunksize=2))
+
+    for name, slot in PANEL_SLOTS.items():
+        ax = fig.add_subplot(gs[slot])
+        ax.imshow(images[name])
+        ax.axis('off')
+
+    return fig
+
+def _build_dashboard(data, index=None):
+    """Lay out and plot all panels, returning (fig, axes, artists) keyed by panel name"""
+
+    # Create figure with custom layout - 12 panels for comprehensive analysis
+    fig = plt.figure(figsize=(24, 16), layout='constrained')
+    fig.suptitle("Ultra-Realistic Factory Analysis Dashboard", fontsize=20, fontweight='bold')
 
     # Create grid layout - 4 rows, 3 columns
-    gs = gridspec.GridSpec(4, 3, figure=fig, hspace=0.3, wspace=0.25)
+    gs = gridspec.GridSpec(4, 3, figure=fig)
 
     # Extract data
     config = data.get("config", {})
@@ -45,62 +357,241 @@ def create_ultra_dashboard(data):
     simulation_time = final_status.get('time', 0)
     simulation_days = simulation_time / 24 if simulation_time > 0 else 1
 
+    # Scan the log once and share the result with every panel
+    if index is None:
+        index = build_dashboard_index(data)
+    series = metric_arrays(metrics)
+
+    # Keep the axes and data-driven artists so Dashboard can update them in place
+    axes = {}
+    artists = {}
+
     # ========== Panel 1: Resource Inventory Levels ==========
-    ax1 = fig.add_subplot(gs[0, 0])
-    plot_resource_inventory(ax1, completed_tasks, log_entries)
+    axes['inventory'] = ax1 = fig.add_subplot(gs[0, 0])
+    artists['inventory'] = plot_resource_inventory(ax1, index)
 
     # ========== Panel 2: Module Health Grid ==========
-    ax2 = fig.add_subplot(gs[0, 1])
-    plot_module_health_grid(ax2, final_status, log_entries)
+    axes['health'] = ax2 = fig.add_subplot(gs[0, 1])
+    plot_module_health_grid(ax2, final_status, index)
 
     # ========== Panel 3: Blocking Reasons Breakdown ==========
-    ax3 = fig.add_subplot(gs[0, 2])
-    plot_blocking_breakdown(ax3, log_entries, final_status)
+    axes['blocking'] = ax3 = fig.add_subplot(gs[0, 2])
+    plot_blocking_breakdown(ax3, index, final_status)
 
     # ========== Panel 4: Energy Balance Over Time ==========
-    ax4 = fig.add_subplot(gs[1, 0])
-    plot_energy_balance(ax4, metrics, config)
+    axes['energy'] = ax4 = fig.add_subplot(gs[1, 0])
+    plot_energy_balance(ax4, series, config)
 
     # ========== Panel 5: Transport System Status ==========
-    ax5 = fig.add_subplot(gs[1, 1])
-    plot_transport_status(ax5, final_status, log_entries)
+    axes['transport'] = ax5 = fig.add_subplot(gs[1, 1])
+    artists['transport'] = plot_transport_status(ax5, final_status, index)
 
     # ========== Panel 6: Software Development Progress ==========
-    ax6 = fig.add_subplot(gs[1, 2])
-    plot_software_progress(ax6, final_status, completed_tasks)
+    axes['software'] = ax6 = fig.add_subplot(gs[1, 2])
+    artists['software'] = plot_software_progress(ax6, final_status, completed_tasks)
 
     # ========== Panel 7: Production Timeline ==========
-    ax7 = fig.add_subplot(gs[2, 0])
+    axes['timeline'] = ax7 = fig.add_subplot(gs[2, 0])
     plot_production_timeline(ax7, completed_tasks, simulation_days)
 
     # ========== Panel 8: Waste & Recycling Flow ==========
-    ax8 = fig.add_subplot(gs[2, 1])
+    axes['waste'] = ax8 = fig.add_subplot(gs[2, 1])
     plot_waste_flow(ax8, final_status, completed_tasks)
 
     # ========== Panel 9: Failure Cascade Analysis ==========
-    ax9 = fig.add_subplot(gs[2, 2])
-    plot_failure_cascade(ax9, log_entries)
+    axes['cascade'] = ax9 = fig.add_subplot(gs[2, 2])
+    plot_failure_cascade(ax9, index)
 
     # ========== Panel 10-12: Summary Statistics ==========
-    ax10 = fig.add_subplot(gs[3, :])
-    plot_summary_statistics(ax10, data)
+    axes['summary'] = ax10 = fig.add_subplot(gs[3, :])
+    artists['summary'] = plot_summary_statistics(ax10, data, index)
 
-    plt.tight_layout()
-    return fig
+    return fig, axes, artists
+
+def _replot_panel(name, ax, data, index):
+    """Clear one dashboard panel and plot it again from fresh data"""
+    config = data.get("config", {})
+    final_status = data.get("final_status", {})
+    completed_tasks = data.get("completed_tasks", [])
+    simulation_time = final_status.get('time', 0)
 
-def plot_resource_inventory(ax, completed_tasks, log_entries):
+    ax.cla()
+    if name == 'inventory':
+        return plot_resource_inventory(ax, index)
+    if name == 'health':
+        return plot_module_health_grid(ax, final_status, index)
+    if name == 'blocking':
+        return plot_blocking_breakdown(ax, index, final_status)
+    if name == 'energy':
+        return plot_energy_balance(ax, metric_arrays(data.get("metrics", {})), config)
+    if name == 'transport':
+        return plot_transport_status(ax, final_status, index)
+    if name == 'software':
+        return plot_software_progress(ax, final_status, completed_tasks)
+    if name == 'timeline':
+        return plot_production_timeline(ax, completed_tasks, simulation_time / 24 if simulation_time > 0 else 1)
+    if name == 'waste':
+        return plot_waste_flow(ax, final_status, completed_tasks)
+    if name == 'cascade':
+        return plot_failure_cascade(ax, index)
+    if name == 'summary':
+        return plot_summary_statistics(ax, data, index)
+    raise ValueError(f"Unknown dashboard panel: {name}")
+
+def _panel_signatures(data, index):
+    """Cheap fingerprints of the inputs of panels that can only be redrawn in full"""
+    final_status = data.get("final_status", {})
+    completed_tasks = data.get("completed_tasks", [])
+    metrics = data.get("metrics", {})
+    return {
+        'energy': (len(metrics.get('time', [])), len(metrics.get('battery_charge', []))),
+        'health': (tuple(final_status.get('modules', {}).items()), frozenset(index.failed_modules)),
+        'blocking': (tuple(index.blocking_counts.items()), final_status.get('blocked_tasks', 0)),
+        'timeline': (len(completed_tasks), final_status.get('time', 0)),
+        'waste': final_status.get('waste_total', 0),
+        'cascade': tuple(index.critical_events),
+    }
+
+class Dashboard:
+    """
+    Persistent dashboard for live monitoring of a running simulation.
+
+    The 12-panel layout is built once. refresh() updates bar sizes, value
+    labels and the summary text in place and blits just those artists over a
+    cached background. Panels whose inputs changed structurally (new axis
+    limits, different resources, new pie slices) fall back to a full redraw.
+    """
+
+    # Panels whose artists are updated in place rather than replotted
+    LIVE_PANELS = ('inventory', 'transport', 'software', 'summary')
+
+    def __init__(self, data, index=None):
+        if index is None:
+            index = build_dashboard_index(data)
+        self.fig, self.axes, self.artists = _build_dashboard(data, index)
+        self._signatures = _panel_signatures(data, index)
+        self._inventory_names = [name for name, _ in index.top_resources]
+        self._background = None
+        self._animated = False
+        self._set_animated(True)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _live_artists(self):
+        """Flatten the in-place updated artists of every live panel"""
+        for name in self.LIVE_PANELS:
+            panel = self.artists.get(name)
+            if panel is None:
+                continue
+            if name in ('transport', 'software'):
+                bars, labels = panel
+                yield from bars
+                yield from labels
+            else:
+                yield from panel
+
+    def _set_animated(self, animated):
+        self._animated = animated
+        for artist in self._live_artists():
+            artist.set_animated(animated)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw and overlay the live artists"""
+        canvas = self.fig.canvas
+        if not self._animated or not canvas.supports_blit:
+            return
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._live_artists():
+            self.fig.draw_artist(artist)
+
+    def refresh(self, data, index=None):
+        """Update the dashboard from new simulation data, blitting when possible"""
+        if index is None:
+            index = build_dashboard_index(data)
+        canvas = self.fig.canvas
+        full_redraw = self._background is None or not canvas.supports_blit
+
+        self._set_animated(False)
+        for name in self.LIVE_PANELS:
+            if not self._update_live(name, data, index):
+                self.artists[name] = _replot_panel(name, self.axes[name], data, index)
+                full_redraw = True
+        self._inventory_names = [name for name, _ in index.top_resources]
+
+        signatures = _panel_signatures(data, index)
+        for name, signature in signatures.items():
+            if signature != self._signatures.get(name):
+                _replot_panel(name, self.axes[name], data, index)
+                full_redraw = True
+        self._signatures = signatures
+        self._set_animated(True)
+
+        if full_redraw:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            for artist in self._live_artists():
+                self.fig.draw_artist(artist)
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def _update_live(self, name, data, index):
+        """Update a live panel's artists in place; False if it needs a full replot"""
+        ax = self.axes[name]
+        panel = self.artists.get(name)
+        if panel is None:
+            return False
+
+        if name == 'inventory':
+            names = [r[0] for r in index.top_resources]
+            quantities = [r[1] for r in index.top_resources]
+            if names != self._inventory_names or max(quantities) > ax.get_xlim()[1]:
+                return False
+            for bar, quantity in zip(panel, quantities):
+                bar.set_width(quantity)
+            return True
+
+        if name in ('transport', 'software'):
+            final_status = data.get("final_status", {})
+            if name == 'transport':
+                values = transport_values(final_status, index)
+            else:
+                values = software_values(data.get("completed_tasks", []))
+            if max(values) > ax.get_ylim()[1]:
+                return False
+            bars, labels = panel
+            for bar, val in zip(bars, values):
+                bar.set_height(val)
+            for label in labels:
+                label.remove()
+            self.artists[name] = (bars, _label_bars(ax, bars, values, skip_zero=(name == 'software')))
+            return True
+
+        if name == 'summary':
+            col1_text, col2_text, col3_text, status, color = summary_text(data, index)
+            col1, col2, col3, status_label = panel
+            col1.set_text(col1_text)
+            col2.set_text(col2_text)
+            col3.set_text(col3_text)
+            status_label.set_text(f'Overall Status: {status}')
+            status_label.set_color(color)
+            return True
+
+        return False
+
+    def save(self, output_file, **kwargs):
+        """Save the current dashboard, including the live artists"""
+        self._set_animated(False)
+        try:
+            self.fig.savefig(output_file, **kwargs)
+        finally:
+            self._set_animated(True)
+
+def plot_resource_inventory(ax, index):
     """Show top resources in inventory"""
     ax.set_title("Resource Inventory (Top 15)", fontweight='bold')
 
-    # Count resources from completed tasks
-    resources = defaultdict(float)
-    for task in completed_tasks:
-        output = task.get('output', 'unknown')
-        quantity = task.get('actual_output', task.get('quantity', 0))
-        resources[output] += quantity
-
-    # Sort and get top 15
-    sorted_resources = sorted(resources.items(), key=lambda x: x[1], reverse=True)[:15]
+    sorted_resources = index.top_resources
+    bars = None
 
     if sorted_resources:
         names = [r[0].replace('_', '\n') for r in sorted_resources]
@@ -131,8 +622,9 @@ def plot_resource_inventory(ax, completed_tasks, log_entries):
         ax.text(0.5, 0.5, 'No Resources Produced', ha='center', va='center', fontsize=12)
 
     ax.set_xlim(left=0)
+    return bars
 
-def plot_module_health_grid(ax, final_status, log_entries):
+def plot_module_health_grid(ax, final_status, index):
     """Visual grid showing module status and health"""
     ax.set_title("Module Status Grid", fontweight='bold')
 
@@ -146,13 +638,7 @@ def plot_module_health_grid(ax, final_status, log_entries):
         ['testing', 'thermal', 'power', 'control']
     ]
 
-    # Check for failures in log
-    failed_modules = set()
-    for entry in log_entries:
-        if 'FAILED' in entry.get('message', ''):
-            for module in modules.keys():
-                if module in entry['message'].lower():
-                    failed_modules.add(module)
+    failed_modules = index.failed_modules
 
     # Draw grid
     for i, row in enumerate(module_layout):
@@ -197,29 +683,11 @@ def plot_module_health_grid(ax, final_status, log_entries):
     ]
     ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=8)
 
-def plot_blocking_breakdown(ax, log_entries, final_status):
+def plot_blocking_breakdown(ax, index, final_status):
     """Pie chart of blocking reasons"""
     ax.set_title("Task Blocking Reasons", fontweight='bold')
 
-    # Count blocking reasons
-    blocking_reasons = defaultdict(int)
-    for entry in log_entries:
-        msg = entry.get('message', '')
-        if 'blocked' in msg.lower():
-            if 'energy' in msg.lower():
-                blocking_reasons['Energy'] += 1
-            elif 'module' in msg.lower() or 'no ' in msg.lower():
-                blocking_reasons['Module\nUnavailable'] += 1
-            elif 'resource' in msg.lower() or 'needs' in msg.lower():
-                blocking_reasons['Missing\nResources'] += 1
-            elif 'dependencies' in msg.lower():
-                blocking_reasons['Dependencies'] += 1
-            elif 'thermal' in msg.lower():
-                blocking_reasons['Thermal'] += 1
-            elif 'storage' in msg.lower():
-                blocking_reasons['Storage'] += 1
-            else:
-                blocking_reasons['Other'] += 1
+    blocking_reasons = index.blocking_counts
 
     if blocking_reasons:
         labels = list(blocking_reasons.keys())
@@ -241,23 +709,26 @@ def plot_blocking_breakdown(ax, log_entries, final_status):
     else:
         ax.text(0.5, 0.5, 'No Blocked Tasks', ha='center', va='center', fontsize=12)
 
-def plot_energy_balance(ax, metrics, config):
-    """Energy generation vs consumption over time"""
+def metric_arrays(metrics):
+    """Convert every metrics series to a float32 array once for all panels"""
+    return {key: np.asarray(values, dtype=np.float32) for key, values in metrics.items()}
+
+def plot_energy_balance(ax, series, config):
+    """Energy generation vs consumption over time (series from metric_arrays)"""
     ax.set_title("Energy Balance", fontweight='bold')
 
-    if metrics and 'time' in metrics and len(metrics['time']) > 0:
-        times = np.array(metrics['time']) / 24  # Convert to days
+    if 'time' in series and series['time'].size > 0:
+        times = series['time'] * (1 / 24)  # Convert to days
 
-        # Calculate theoretical generation
+        # Theoretical average generation (simplified)
         solar_capacity = config.get('initial_solar_capacity_kw', 100)
-        generation = [solar_capacity * 8 / 24 for _ in times]  # Simplified
 
         # Use battery charge as proxy for consumption
-        if 'battery_charge' in metrics:
-            battery = metrics['battery_charge']
+        if 'battery_charge' in series:
+            battery = series['battery_charge'][:times.size]
 
-            ax.plot(times[:len(battery)], battery, 'b-', label='Battery Charge', linewidth=2)
-            ax.fill_between(times[:len(battery)], 0, battery, alpha=0.3, color='blue')
+            ax.plot(times[:battery.size], battery, 'b-', label='Battery Charge', linewidth=2)
+            ax.fill_between(times[:battery.size], 0, battery, alpha=0.3, color='blue', rasterized=True)
 
         ax.axhline(y=solar_capacity * 8 / 24, color='orange', linestyle='--', label=f'Avg Solar ({solar_capacity}kW)', alpha=0.7)
 
@@ -265,40 +736,33 @@ def plot_energy_balance(ax, metrics, config):
         ax.set_ylabel("Energy (kWh)")
         ax.legend(loc='best')
         ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, max(times) if len(times) > 0 else 1)
+        ax.set_xlim(0, times.max() if times.size > 0 else 1)
     else:
         ax.text(0.5, 0.5, 'No Energy Data', ha='center', va='center', fontsize=12)
 
-def plot_transport_status(ax, final_status, log_entries):
-    """Transport system utilization"""
-    ax.set_title("Transport System Status", fontweight='bold')
+def _label_bars(ax, bars, values, skip_zero=False):
+    """Write each bar's value above it and return the created label artists"""
+    texts = ['' if skip_zero and val <= 0 else f'{int(val)}' for val in values]
+    return ax.bar_label(bars, labels=texts, fontweight='bold')
 
-    transport_completed = final_status.get('transport_completed', 0)
+def transport_values(final_status, index):
+    """Scheduled, completed and AGV-busy transport counts"""
+    transport_events = index.transport_events
+    return [transport_events['scheduled'], final_status.get('transport_completed', 0), transport_events['agv_busy']]
 
-    # Count transport events in log
-    transport_events = {'scheduled': 0, 'completed': 0, 'agv_busy': 0}
-    for entry in log_entries:
-        msg = entry.get('message', '')
-        if 'transport' in msg.lower():
-            if 'scheduled' in msg.lower():
-                transport_events['scheduled'] += 1
-            elif 'completed' in msg.lower():
-                transport_events['completed'] += 1
-            elif 'agv' in msg.lower() and 'busy' in msg.lower():
-                transport_events['agv_busy'] += 1
+def plot_transport_status(ax, final_status, index):
+    """Transport system utilization"""
+    ax.set_title("Transport System Status", fontweight='bold')
 
     # Create bars
     categories = ['Scheduled', 'Completed', 'AGV Busy\nEvents']
-    values = [transport_events['scheduled'], transport_completed, transport_events['agv_busy']]
+    values = transport_values(final_status, index)
     colors = ['#4682B4', '#32CD32', '#FF6347']
 
     bars = ax.bar(categories, values, color=colors, alpha=0.7)
 
     # Add value labels
-    for bar, val in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(val)}', ha='center', va='bottom', fontweight='bold')
+    labels = _label_bars(ax, bars, values)
 
     ax.set_ylabel("Count")
     ax.grid(True, alpha=0.3, axis='y')
@@ -308,6 +772,18 @@ def plot_transport_status(ax, final_status, log_entries):
     ax.text(0.5, 0.95, f'AGV Fleet Size: {agv_fleet_size}', transform=ax.transAxes,
             ha='center', fontsize=10, fontweight='bold')
 
+    return bars, labels
+
+def software_values(completed_tasks):
+    """Developed package counts for PLC, robot firmware, AI model and SCADA software"""
+    software_types = {'plc_program': 0, 'robot_firmware': 0, 'ai_model': 0, 'scada_system': 0}
+    for task in completed_tasks:
+        output = task.get('output', '')
+        if output in software_types:
+            software_types[output] += task.get('actual_output', 1)
+    return [software_types['plc_program'], software_types['robot_firmware'],
+            software_types['ai_model'], software_types['scada_system']]
+
 def plot_software_progress(ax, final_status, completed_tasks):
     """Software development progress"""
     ax.set_title("Software Development", fontweight='bold')
@@ -315,77 +791,61 @@ def plot_software_progress(ax, final_status, completed_tasks):
     software_packages = final_status.get('software_packages', 0)
 
     # Count software types from completed tasks
-    software_types = {'plc_program': 0, 'robot_firmware': 0, 'ai_model': 0, 'scada_system': 0}
-    for task in completed_tasks:
-        output = task.get('output', '')
-        if output in software_types:
-            software_types[output] += task.get('actual_output', 1)
+    values = software_values(completed_tasks)
 
     # Create stacked bar
     labels = ['PLC\nProgram', 'Robot\nFirmware', 'AI\nModel', 'SCADA\nSystem']
-    values = [software_types['plc_program'], software_types['robot_firmware'],
-              software_types['ai_model'], software_types['scada_system']]
     colors = ['#4169E1', '#FF6347', '#32CD32', '#FFD700']
 
     bars = ax.bar(labels, values, color=colors, alpha=0.8)
 
     # Add value labels
-    for bar, val in zip(bars, values):
-        if val > 0:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(val)}', ha='center', va='bottom', fontweight='bold')
+    value_labels = _label_bars(ax, bars, values, skip_zero=True)
 
     ax.set_ylabel("Packages Developed")
-    ax.set_ylim(0, max(values) * 1.2 if max(values) > 0 else 1)
+    vmax = max(values)
+    ax.set_ylim(0, vmax * 1.2 if vmax > 0 else 1)
     ax.grid(True, alpha=0.3, axis='y')
 
     # Add total
     ax.text(0.5, 0.95, f'Total Software: {software_packages} packages',
             transform=ax.transAxes, ha='center', fontsize=10, fontweight='bold')
 
+    return bars, value_labels
+
 def plot_production_timeline(ax, completed_tasks, simulation_days):
     """Timeline of what was produced"""
     ax.set_title("Production Timeline", fontweight='bold')
 
     if completed_tasks:
-        # Group by category
-        categories = {
-            'Raw Materials': [],
-            'Chemicals': [],
-            'Refined': [],
-            'Components': [],
-            'Software': [],
-            'Modules': []
-        }
-
-        for task in completed_tasks:
-            time = task.get('completion_time', 0) / 24  # Convert to days
-            output = task.get('output', 'unknown')
-
-            if '_ore' in output:
-                categories['Raw Materials'].append(time)
-            elif 'acid' in output or 'chemical' in output or 'solvent' in output:
-                categories['Chemicals'].append(time)
-            elif 'steel' in output or 'wire' in output or 'sheet' in output:
-                categories['Refined'].append(time)
-            elif '_module' in output:
-                categories['Modules'].append(time)
-            elif 'program' in output or 'firmware' in output or 'model' in output:
-                categories['Software'].append(time)
-            else:
-                categories['Components'].append(time)
+        outputs = np.array([t.get('output', 'unknown') for t in completed_tasks], dtype=str)
+        times = np.fromiter((t.get('completion_time', 0) / 24 for t in completed_tasks),
+                            dtype=np.float64, count=len(completed_tasks))  # Convert to days
+
+        # Group by category - rules are applied in priority order, first match wins
+        masks = {}
+        unassigned = np.ones(outputs.size, dtype=bool)
+        for cat, patterns in TIMELINE_CATEGORY_RULES:
+            matched = np.zeros(outputs.size, dtype=bool)
+            for pattern in patterns:
+                matched |= np.char.find(outputs, pattern) >= 0
+            masks[cat] = matched & unassigned
+            unassigned &= ~matched
+        masks['Components'] = unassigned
 
         # Plot timeline
+        categories = ['Raw Materials', 'Chemicals', 'Refined', 'Components', 'Software', 'Modules']
         y_positions = list(range(len(categories)))
         colors = ['#8B4513', '#9370DB', '#4682B4', '#FFD700', '#00CED1', '#FF6347']
 
-        for i, (cat, times) in enumerate(categories.items()):
-            if times:
-                ax.scatter(times, [i]*len(times), alpha=0.7, s=30, color=colors[i], label=cat)
+        for i, cat in enumerate(categories):
+            cat_times = times[masks[cat]]
+            if cat_times.size:
+                ax.scatter(cat_times, np.full_like(cat_times, i), alpha=0.7, s=30, color=colors[i], label=cat,
+                           rasterized=True)
 
         ax.set_yticks(y_positions)
-        ax.set_yticklabels(list(categories.keys()))
+        ax.set_yticklabels(categories)
         ax.set_xlabel("Time (days)")
         ax.set_xlim(0, simulation_days)
         ax.grid(True, alpha=0.3, axis='x')
@@ -425,25 +885,11 @@ def plot_waste_flow(ax, final_status, completed_tasks):
     else:
         ax.text(0.5, 0.5, 'No Waste Generated', ha='center', va='center', fontsize=12)
 
-def plot_failure_cascade(ax, log_entries):
+def plot_failure_cascade(ax, index):
     """Show how failures propagated"""
     ax.set_title("Failure Cascade Timeline", fontweight='bold')
 
-    # Find critical events
-    critical_events = []
-    for entry in log_entries:
-        msg = entry.get('message', '')
-        time = entry.get('timestamp', 0) / 24  # Convert to days
-
-        if 'FAILED' in msg:
-            critical_events.append(('FAILURE', time, msg[:50]))
-        elif 'blocked' in msg and len(critical_events) < 20:  # Limit to first 20
-            if 'mining' in msg.lower():
-                critical_events.append(('BLOCK-MINING', time, 'Mining unavailable'))
-            elif 'energy' in msg.lower():
-                critical_events.append(('BLOCK-ENERGY', time, 'Energy shortage'))
-            elif 'module' in msg.lower():
-                critical_events.append(('BLOCK-MODULE', time, 'Module unavailable'))
+    critical_events = index.critical_events
 
     if critical_events:
         # Get unique events
@@ -455,8 +901,10 @@ def plot_failure_cascade(ax, log_entries):
                 seen.add(key)
                 unique_events.append(event)
 
-        # Plot timeline
-        event_types = list(set(e[0] for e in unique_events))
+        # Plot timeline, one row per event type in first-seen order
+        type_to_y = {}
+        for e in unique_events:
+            type_to_y.setdefault(e[0], len(type_to_y))
         colors_map = {
             'FAILURE': 'red',
             'BLOCK-MINING': 'orange',
@@ -464,15 +912,14 @@ def plot_failure_cascade(ax, log_entries):
             'BLOCK-MODULE': 'purple'
         }
 
-        for event in unique_events[:20]:  # Limit display
-            event_type, time, msg = event
-            y_pos = event_types.index(event_type)
-            color = colors_map.get(event_type, 'gray')
-
-            ax.scatter(time, y_pos, color=color, s=100, alpha=0.7, edgecolor='black')
+        shown = unique_events[:20]  # Limit display
+        xs = np.fromiter((e[1] for e in shown), dtype=np.float64, count=len(shown))
+        ys = np.fromiter((type_to_y[e[0]] for e in shown), dtype=np.int64, count=len(shown))
+        cols = [colors_map.get(e[0], 'gray') for e in shown]
+        ax.scatter(xs, ys, c=cols, s=100, alpha=0.7, edgecolor='black', rasterized=True)
 
-        ax.set_yticks(range(len(event_types)))
-        ax.set_yticklabels(event_types)
+        ax.set_yticks(range(len(type_to_y)))
+        ax.set_yticklabels(list(type_to_y))
         ax.set_xlabel("Time (days)")
         ax.grid(True, alpha=0.3, axis='x')
 
@@ -480,18 +927,16 @@ def plot_failure_cascade(ax, log_entries):
         if unique_events:
             first_failure = next((e for e in unique_events if e[0] == 'FAILURE'), None)
             if first_failure:
+                failure_y = type_to_y['FAILURE']
                 ax.annotate(f'First Failure\nDay {first_failure[1]:.1f}',
-                          xy=(first_failure[1], 0), xytext=(first_failure[1], -0.5),
+                          xy=(first_failure[1], failure_y), xytext=(first_failure[1], failure_y - 0.5),
                           arrowprops=dict(arrowstyle='->', color='red'),
                           fontsize=9, ha='center')
     else:
         ax.text(0.5, 0.5, 'No Failures Detected', ha='center', va='center', fontsize=12)
 
-def plot_summary_statistics(ax, data):
-    """Summary statistics and recommendations"""
-    ax.set_title("Summary Statistics & Recommendations", fontweight='bold')
-    ax.axis('off')
-
+def summary_text(data, index):
+    """Return the three summary columns plus the overall status label and colour"""
     final_status = data.get('final_status', {})
     config = data.get('config', {})
 
@@ -531,16 +976,7 @@ def plot_summary_statistics(ax, data):
     """
 
     # Determine main bottleneck
-    log_entries = data.get('log_entries', [])
-    blocking_reasons = defaultdict(int)
-    for entry in log_entries:
-        if 'blocked' in entry.get('message', '').lower():
-            if 'mining' in entry['message'].lower():
-                blocking_reasons['Mining Module'] += 1
-            elif 'energy' in entry['message'].lower():
-                blocking_reasons['Energy'] += 1
-            elif 'module' in entry['message'].lower():
-                blocking_reasons['Module Availability'] += 1
+    blocking_reasons = index.bottleneck_counts
 
     main_bottleneck = max(blocking_reasons.items(), key=lambda x: x[1])[0] if blocking_reasons else "Unknown"
 
@@ -554,14 +990,6 @@ def plot_summary_statistics(ax, data):
     • {'✓ Software development on track' if final_status.get('software_packages', 0) > 20 else '✗ Accelerate software dev'}
     """
 
-    # Display text in columns
-    ax.text(0.05, 0.5, col1_text, transform=ax.transAxes, fontsize=10,
-            verticalalignment='center', family='monospace')
-    ax.text(0.35, 0.5, col2_text, transform=ax.transAxes, fontsize=10,
-            verticalalignment='center', family='monospace')
-    ax.text(0.65, 0.5, col3_text, transform=ax.transAxes, fontsize=10,
-            verticalalignment='center', family='monospace')
-
     # Add status indicator
     if success_rate > 75:
         status = "✅ HEALTHY"
@@ -573,17 +1001,43 @@ def plot_summary_statistics(ax, data):
         status = "❌ FAILED"
         color = 'red'
 
-    ax.text(0.5, 0.95, f'Overall Status: {status}', transform=ax.transAxes,
-            ha='center', fontsize=14, fontweight='bold', color=color)
+    return col1_text, col2_text, col3_text, status, color
+
+def plot_summary_statistics(ax, data, index):
+    """Summary statistics and recommendations"""
+    ax.set_title("Summary Statistics & Recommendations", fontweight='bold')
+    ax.axis('off')
+
+    col1_text, col2_text, col3_text, status, color = summary_text(data, index)
+
+    # Display text in columns
+    col1 = ax.text(0.05, 0.5, col1_text, transform=ax.transAxes, fontsize=10,
+                   verticalalignment='center', family='monospace')
+    col2 = ax.text(0.35, 0.5, col2_text, transform=ax.transAxes, fontsize=10,
+                   verticalalignment='center', family='monospace')
+    col3 = ax.text(0.65, 0.5, col3_text, transform=ax.transAxes, fontsize=10,
+                   verticalalignment='center', family='monospace')
+
+    # Add status indicator
+    status_label = ax.text(0.5, 0.95, f'Overall Status: {status}', transform=ax.transAxes,
+                           ha='center', fontsize=14, fontweight='bold', color=color)
+
+    return col1, col2, col3, status_label
 
 def main():
     """Main analysis function"""
+    parser = argparse.ArgumentParser(description="Analyze factory simulation results")
+    parser.add_argument('--parallel', action='store_true',
+                        help='Render dashboard panels in parallel worker processes')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("ULTRA-REALISTIC FACTORY SIMULATION ANALYSIS")
     print("=" * 80)
 
     # Load data
-    data = load_simulation_data()
+    log_file = "factory_simulation_log.json"
+    data = load_simulation_data(log_file)
     if not data:
         return
 
@@ -600,14 +1054,17 @@ def main():
     print(f"  Software Packages: {final_status.get('software_packages', 0)}")
 
     modules = final_status.get("modules", {})
-    failed_count = sum(1 for v in modules.values() if v == 0)
+    module_counts = np.fromiter(modules.values(), dtype=np.int64, count=len(modules))
+    operational_count = int((module_counts > 0).sum())
+    failed_count = int((module_counts == 0).sum())
     print(f"\n🏭 MODULE STATUS:")
-    print(f"  Operational: {sum(1 for v in modules.values() if v > 0)}/{len(modules)}")
+    print(f"  Operational: {operational_count}/{len(modules)}")
     print(f"  Failed/Missing: {failed_count}")
 
     # Create visualization
     print("\n📊 Creating ultra-realistic dashboard...")
-    fig = create_ultra_dashboard(data)
+    index = get_or_build_index(log_file, data)
+    fig = create_ultra_dashboard(data, index, parallel=args.parallel)
 
     # Save
     output_file = 'factory_simulation_analysis_ultra.png'
@@ -6,8 +6,9 @@ This module provides validated configuration schemas for the factory simulation,
 ensuring that all configuration parameters are valid at runtime.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 
 
@@ -23,6 +24,15 @@ class UpdateStrategyConfig(str, Enum):
     DEPENDENCY = "dependency"
 
 
+# Validated configs are read-only once built; assignment validation is never
+# needed and unknown keys inside a section are a typo, not a setting.
+_SECTION_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra='forbid',
+    validate_assignment=False,
+)
+
+
 # ===============================================================================
 # BASE CONFIGURATION
 # ===============================================================================
@@ -30,6 +40,8 @@ class UpdateStrategyConfig(str, Enum):
 class EnergyConfig(BaseModel):
     """Energy system configuration"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     initial_solar_capacity_kw: float = Field(
         default=100,
         gt=0,
@@ -75,6 +87,8 @@ class EnergyConfig(BaseModel):
 class ProcessingConfig(BaseModel):
     """Processing and production configuration"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     mining_power_multiplier: float = Field(
         default=1.0,
         gt=0,
@@ -127,6 +141,8 @@ class ProcessingConfig(BaseModel):
 class FeatureToggles(BaseModel):
     """Feature toggle configuration"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     enable_capacity_limits: bool = Field(
         default=True,
         description="Enable module throughput capacity limits"
@@ -191,6 +207,8 @@ class FeatureToggles(BaseModel):
 class PhysicalConstraints(BaseModel):
     """Physical facility constraints"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     factory_area_m2: float = Field(
         default=20000,
         gt=0,
@@ -220,6 +238,8 @@ class PhysicalConstraints(BaseModel):
 class QualityConfig(BaseModel):
     """Quality control configuration"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     target_quality_rate: float = Field(
         default=0.95,
         gt=0,
@@ -238,6 +258,8 @@ class QualityConfig(BaseModel):
 class TransportConfig(BaseModel):
     """Transport system configuration"""
 
+    model_config = _SECTION_MODEL_CONFIG
+
     agv_fleet_size: int = Field(
         default=10,
         ge=1,
@@ -252,6 +274,23 @@ class TransportConfig(BaseModel):
     )
 
 
+# FactoryConfig attribute -> sub-config model, in flattening order
+_SECTION_MODELS = {
+    "energy": EnergyConfig,
+    "processing": ProcessingConfig,
+    "features": FeatureToggles,
+    "physical": PhysicalConstraints,
+    "quality": QualityConfig,
+    "transport": TransportConfig,
+}
+_SECTION_NAMES = tuple(_SECTION_MODELS)
+_FIELD_NAMES = {model: tuple(model.model_fields) for model in _SECTION_MODELS.values()}
+
+# Flat legacy key -> FactoryConfig attribute of the sub-config that owns it
+_KEY_TO_SECTION = {key: section for section, model in _SECTION_MODELS.items()
+                   for key in _FIELD_NAMES[model]}
+
+
 # ===============================================================================
 # MAIN FACTORY CONFIGURATION
 # ===============================================================================
@@ -259,6 +298,15 @@ class TransportConfig(BaseModel):
 class FactoryConfig(BaseModel):
     """Complete validated factory configuration"""
 
+    # Spec-generated configs carry extra keys (e.g. ``energy_enabled``) that
+    # the legacy flat format passes through, so unknown top-level keys are
+    # ignored rather than forbidden.
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        validate_assignment=False,
+    )
+
     # Sub-configurations
     energy: EnergyConfig = Field(default_factory=EnergyConfig)
     processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
@@ -313,29 +361,12 @@ class FactoryConfig(BaseModel):
         """Convert to flat dictionary for legacy compatibility"""
         result = {}
 
-        # Flatten energy config
-        for key, value in self.energy.model_dump().items():
-            result[key] = value
-
-        # Flatten processing config
-        for key, value in self.processing.model_dump().items():
-            result[key] = value
-
-        # Flatten feature toggles
-        for key, value in self.features.model_dump().items():
-            result[key] = value
-
-        # Flatten physical constraints
-        for key, value in self.physical.model_dump().items():
-            result[key] = value
-
-        # Flatten quality config
-        for key, value in self.quality.model_dump().items():
-            result[key] = value
-
-        # Flatten transport config
-        for key, value in self.transport.model_dump().items():
-            result[key] = value
+        # Flatten each sub-config by its cached field names; every field is a
+        # plain scalar, so model_dump's serializer walk is unnecessary
+        for section in _SECTION_NAMES:
+            sub_config = getattr(self, section)
+            for key in _FIELD_NAMES[type(sub_config)]:
+                result[key] = getattr(sub_config, key)
 
         # Add top-level params
         result["simulation_name"] = self.simulation_name
@@ -349,47 +380,19 @@ class FactoryConfig(BaseModel):
     def from_dict(cls, config_dict: Dict[str, Any]) -> "FactoryConfig":
         """Create from flat dictionary (legacy format)"""
         # Group by category
-        energy_params = {}
-        processing_params = {}
-        feature_params = {}
-        physical_params = {}
-        quality_params = {}
-        transport_params = {}
+        sections = {section: {} for section in _SECTION_NAMES}
         top_level_params = {}
 
-        # Map known keys to categories
-        energy_keys = set(EnergyConfig.model_fields.keys())
-        processing_keys = set(ProcessingConfig.model_fields.keys())
-        feature_keys = set(FeatureToggles.model_fields.keys())
-        physical_keys = set(PhysicalConstraints.model_fields.keys())
-        quality_keys = set(QualityConfig.model_fields.keys())
-        transport_keys = set(TransportConfig.model_fields.keys())
-
         for key, value in config_dict.items():
-            if key in energy_keys:
-                energy_params[key] = value
-            elif key in processing_keys:
-                processing_params[key] = value
-            elif key in feature_keys:
-                feature_params[key] = value
-            elif key in physical_keys:
-                physical_params[key] = value
-            elif key in quality_keys:
-                quality_params[key] = value
-            elif key in transport_keys:
-                transport_params[key] = value
-            else:
+            section = _KEY_TO_SECTION.get(key)
+            if section is None:
                 top_level_params[key] = value
+            else:
+                sections[section][key] = value
 
-        return cls(
-            energy=EnergyConfig(**energy_params) if energy_params else EnergyConfig(),
-            processing=ProcessingConfig(**processing_params) if processing_params else ProcessingConfig(),
-            features=FeatureToggles(**feature_params) if feature_params else FeatureToggles(),
-            physical=PhysicalConstraints(**physical_params) if physical_params else PhysicalConstraints(),
-            quality=QualityConfig(**quality_params) if quality_params else QualityConfig(),
-            transport=TransportConfig(**transport_params) if transport_params else TransportConfig(),
-            **top_level_params
-        )
+        # Validate the nested sections in a single pydantic-core pass instead
+        # of building each sub-model separately in Python
+        return cls.model_validate({**sections, **top_level_params})
 
 
 # ===============================================================================
@@ -418,10 +421,13 @@ def validate_config(config_dict: Dict[str, Any]) -> FactoryConfig:
     return FactoryConfig.from_dict(config_dict)
 
 
+@lru_cache(maxsize=1)
 def get_default_config() -> FactoryConfig:
     """
     Get default factory configuration.
 
+    The models are frozen, so one validated instance is shared by all callers.
+
     Returns:
         FactoryConfig with default values
     """
@@ -28,15 +28,19 @@ class ResourceEnumMixin:
     to convert resource names to enum values.
     """
 
-    def __init__(self, resource_enum: Optional[Enum] = None):
+    def __init__(self, resource_enum: Optional[Enum] = None,
+                 resource_cache: Optional[Dict[str, Any]] = None):
         """
         Initialize mixin with resource enum.
 
         Args:
             resource_enum: ResourceType enum (can be dynamically generated)
+            resource_cache: Name -> enum cache to share with other subsystems
         """
         self.resource_enum = resource_enum
-        self._resource_cache: Dict[str, Any] = {}
+        self._resource_cache: Dict[str, Any] = resource_cache if resource_cache is not None else {}
+        # Name -> member mapping, bound once so lookups skip the enum class
+        self._members = resource_enum.__members__ if resource_enum else {}
 
     def _get_resource_enum(self, resource_name: str) -> Optional[Any]:
         """
@@ -52,23 +56,17 @@ class ResourceEnumMixin:
             >>> enum_val = self._get_resource_enum('STEEL')
             >>> # Returns ResourceType.STEEL if it exists
         """
-        if not self.resource_enum:
-            return None
-
         # Check cache first for performance
-        if resource_name in self._resource_cache:
-            return self._resource_cache[resource_name]
-
-        # Try to get from enum
-        try:
-            if hasattr(self.resource_enum, resource_name):
-                enum_val = getattr(self.resource_enum, resource_name)
-                self._resource_cache[resource_name] = enum_val
-                return enum_val
-        except Exception as e:
-            logger.warning(f"Could not get enum for {resource_name}: {e}")
+        enum_val = self._resource_cache.get(resource_name)
+        if enum_val is not None:
+            return enum_val
 
-        return None
+        # Look up members directly rather than probing attributes, so method
+        # and dunder names on the enum class never resolve as resources
+        enum_val = self._members.get(resource_name)
+        if enum_val is not None:
+            self._resource_cache[resource_name] = enum_val
+        return enum_val
 
     def _convert_config_to_enum_dict(self, config_dict: Dict[str, Any]) -> Dict[Any, Any]:
         """
@@ -85,13 +83,12 @@ class ResourceEnumMixin:
             >>> enum_dict = self._convert_config_to_enum_dict(config)
             >>> # Returns {ResourceType.STEEL: 0.95, ResourceType.ALUMINUM: 0.90}
         """
-        result = {}
-        for resource_name, value in config_dict.items():
-            enum_val = self._get_resource_enum(resource_name)
-            if enum_val:
-                result[enum_val] = value
-            else:
-                logger.debug(f"Resource {resource_name} not found in enum, skipping")
+        members = self._members
+        result = {members[name]: value for name, value in config_dict.items() if name in members}
+
+        missing = [name for name in config_dict if name not in members]
+        if missing:
+            logger.debug(f"Resources {missing} not found in enum, skipping")
         return result
 
     def _clear_cache(self):
@@ -106,15 +103,17 @@ class ResourceEnumMixin:
 class DynamicSubsystemBase(ResourceEnumMixin):
     """Base class for dynamic subsystems with resource enum support"""
 
-    def __init__(self, config: Dict[str, Any], resource_enum: Optional[Enum] = None):
+    def __init__(self, config: Dict[str, Any], resource_enum: Optional[Enum] = None,
+                 resource_cache: Optional[Dict[str, Any]] = None):
         """
         Initialize dynamic subsystem
 
         Args:
             config: Configuration dictionary from spec
             resource_enum: ResourceType enum (can be dynamically generated)
+            resource_cache: Shared name -> enum cache
         """
-        super().__init__(resource_enum)
+        super().__init__(resource_enum, resource_cache)
         self.config = config or {}
         self.enabled = self.config.get('enabled', True)
 
@@ -126,17 +125,20 @@ class DynamicSubsystemBase(ResourceEnumMixin):
 class DynamicWasteStream(ResourceEnumMixin):
     """Dynamic waste stream that works with any ResourceType enum"""
 
-    def __init__(self, config: Optional[Dict] = None, resource_enum: Optional[Enum] = None):
+    def __init__(self, config: Optional[Dict] = None, resource_enum: Optional[Enum] = None,
+                 resource_cache: Optional[Dict[str, Any]] = None):
         """
         Initialize dynamic waste stream
 
         Args:
             config: Configuration with recyclable_materials
             resource_enum: ResourceType enum
+            resource_cache: Shared name -> enum cache
         """
-        super().__init__(resource_enum)
+        super().__init__(resource_enum, resource_cache)
         self.config = config or {}
         self.waste_inventory = defaultdict(float)
+        self._total_waste = 0.0  # Running sum of waste_inventory
 
         # Process recyclable materials from config
         self.recyclable_materials = {}
@@ -171,6 +173,7 @@ class DynamicWasteStream(ResourceEnumMixin):
     def add_waste(self, waste_type, quantity: float):
         """Add waste to stream"""
         self.waste_inventory[waste_type] += quantity
+        self._total_waste += quantity
 
     def process_recycling(self, waste_type, quantity: float) -> float:
         """Process waste for recycling"""
@@ -180,11 +183,12 @@ class DynamicWasteStream(ResourceEnumMixin):
         recovery_rate = self.recyclable_materials[waste_type]
         recovered = available * recovery_rate
         self.waste_inventory[waste_type] -= available
+        self._total_waste -= available
         return recovered
 
     def get_total_waste(self) -> float:
         """Get total waste in system"""
-        return sum(self.waste_inventory.values())
+        return self._total_waste
 
 
 # ===============================================================================
@@ -194,15 +198,17 @@ class DynamicWasteStream(ResourceEnumMixin):
 class DynamicSoftwareProductionSystem(ResourceEnumMixin):
     """Dynamic software production system that works with any ResourceType enum"""
 
-    def __init__(self, config: Optional[Dict] = None, resource_enum: Optional[Enum] = None):
+    def __init__(self, config: Optional[Dict] = None, resource_enum: Optional[Enum] = None,
+                 resource_cache: Optional[Dict[str, Any]] = None):
         """
         Initialize dynamic software production system
 
         Args:
             config: Configuration with bug_rates
             resource_enum: ResourceType enum
+            resource_cache: Shared name -> enum cache
         """
-        super().__init__(resource_enum)
+        super().__init__(resource_enum, resource_cache)
         self.config = config or {}
         self.software_library = {}
         self.development_hours = defaultdict(float)
@@ -276,7 +282,8 @@ class DynamicStorageSystem(ResourceEnumMixin):
                  total_weight_capacity_tons: float,
                  config: Optional[Dict] = None,
                  resource_enum: Optional[Enum] = None,
-                 enabled: bool = True):
+                 enabled: bool = True,
+                 resource_cache: Optional[Dict[str, Any]] = None):
         """
         Initialize dynamic storage system
 
@@ -286,8 +293,9 @@ class DynamicStorageSystem(ResourceEnumMixin):
             config: Configuration with material_properties
             resource_enum: ResourceType enum
             enabled: Whether storage limits are enabled
+            resource_cache: Shared name -> enum cache
         """
-        super().__init__(resource_enum)
+        super().__init__(resource_enum, resource_cache)
         self.total_volume_m3 = total_volume_m3
         self.total_weight_capacity_tons = total_weight_capacity_tons
         self.current_inventory = defaultdict(float)
@@ -297,6 +305,11 @@ class DynamicStorageSystem(ResourceEnumMixin):
         self.temperature_controlled = True
         self.contamination_controlled = True
 
+        # Running totals over current_inventory, kept in step by
+        # add_resource/remove_resource so capacity checks never rescan it
+        self._current_volume_m3 = 0.0
+        self._current_weight_tons = 0.0
+
         # Material properties from config or spec
         self.material_properties = {}
         if 'material_properties' in self.config:
@@ -304,6 +317,13 @@ class DynamicStorageSystem(ResourceEnumMixin):
         else:
             self._load_default_properties()
 
+        # Density is all the capacity checks need, so resolve it once per
+        # resource up front instead of walking get_material_properties
+        self._density_by_resource = {
+            resource: self.get_material_properties(resource)[0]
+            for resource in (resource_enum or self.material_properties)
+        }
+
     def _load_material_properties(self):
         """Load material properties from config"""
         for resource_name, props in self.config['material_properties'].items():
@@ -359,45 +379,55 @@ class DynamicStorageSystem(ResourceEnumMixin):
         # Default fallback
         return (1.0, 25, 0.5)
 
+    def _density(self, resource) -> float:
+        """Get material density from the precomputed table"""
+        return self._density_by_resource.get(resource, 1.0)
+
     def can_store(self, resource, quantity: float) -> Tuple[bool, str]:
         """Check if storage is available with reason"""
         if not self.enabled:
             return (True, "OK")
 
-        # Get material properties
-        density, storage_temp, contamination = self.get_material_properties(resource)
+        # Get material density
+        density = self._density(resource)
 
         # Calculate volume needed
         volume_needed = quantity / density if density > 0 else quantity
 
         # Check volume constraint
-        current_volume = sum(
-            qty / self.get_material_properties(res)[0]
-            for res, qty in self.current_inventory.items()
-        )
-
-        if current_volume + volume_needed > self.total_volume_m3:
+        if self._current_volume_m3 + volume_needed > self.total_volume_m3:
             return (False, f"Insufficient volume: need {volume_needed:.1f}m³")
 
         # Check weight constraint
-        current_weight = sum(self.current_inventory.values())
-        if current_weight + quantity > self.total_weight_capacity_tons:
+        if self._current_weight_tons + quantity > self.total_weight_capacity_tons:
             return (False, f"Insufficient weight capacity: need {quantity:.1f}t")
 
         return (True, "OK")
 
     def add_resource(self, resource, quantity: float) -> bool:
         """Add resource to storage"""
-        can_store, reason = self.can_store(resource, quantity)
-        if not can_store:
-            logger.warning(f"Cannot store {quantity} of {resource}: {reason}")
-            return False
+        # With limits disabled can_store always passes, so skip the call
+        if self.enabled:
+            can_store, reason = self.can_store(resource, quantity)
+            if not can_store:
+                logger.warning(f"Cannot store {quantity} of {resource}: {reason}")
+                return False
 
-        if resource not in self.current_inventory:
-            self.current_inventory[resource] = 0
         self.current_inventory[resource] += quantity
+        self._update_totals(resource, quantity)
         return True
 
+    def remove_resource(self, resource, quantity: float):
+        """Take resource out of storage (callers check availability first)"""
+        self.current_inventory[resource] -= quantity
+        self._update_totals(resource, -quantity)
+
+    def _update_totals(self, resource, quantity: float):
+        """Apply a signed inventory change to the running volume/weight totals"""
+        density = self._density(resource)
+        self._current_volume_m3 += quantity / density if density > 0 else quantity
+        self._current_weight_tons += quantity
+
     def get_available(self, resource) -> float:
         """Get available quantity of resource"""
         return self.current_inventory.get(resource, 0.0)
@@ -405,14 +435,11 @@ class DynamicStorageSystem(ResourceEnumMixin):
     def get_storage_utilization(self) -> Dict[str, float]:
         """Get storage utilization metrics"""
         # Volume utilization
-        current_volume = sum(
-            qty / self.get_material_properties(res)[0]
-            for res, qty in self.current_inventory.items()
-        )
+        current_volume = self._current_volume_m3
         volume_util = current_volume / self.total_volume_m3 if self.total_volume_m3 > 0 else 0
 
         # Weight utilization
-        current_weight = sum(self.current_inventory.values())
+        current_weight = self._current_weight_tons
         weight_util = current_weight / self.total_weight_capacity_tons if self.total_weight_capacity_tons > 0 else 0
 
         return {
@@ -441,29 +468,29 @@ class SubsystemFactory:
         self.spec = spec or {}
         self.resource_enum = resource_enum
         self.subsystem_data = self.spec.get('subsystem_data', {})
+        # One name -> enum map shared by every subsystem this factory builds
+        self._resource_cache = dict(resource_enum.__members__) if resource_enum else {}
 
     def create_waste_stream(self, config: Optional[Dict] = None) -> DynamicWasteStream:
         """Create dynamic waste stream"""
-        # Merge spec config with provided config
-        waste_config = self.subsystem_data.get('waste_stream', {})
-        if config:
-            waste_config.update(config)
+        # Merge spec config with provided config (without touching the spec)
+        waste_config = {**self.subsystem_data.get('waste_stream', {}), **(config or {})}
 
         return DynamicWasteStream(
             config=waste_config,
-            resource_enum=self.resource_enum
+            resource_enum=self.resource_enum,
+            resource_cache=self._resource_cache
         )
 
     def create_software_system(self, config: Optional[Dict] = None) -> DynamicSoftwareProductionSystem:
         """Create dynamic software production system"""
-        # Merge spec config with provided config
-        software_config = self.subsystem_data.get('software_production', {})
-        if config:
-            software_config.update(config)
+        # Merge spec config with provided config (without touching the spec)
+        software_config = {**self.subsystem_data.get('software_production', {}), **(config or {})}
 
         return DynamicSoftwareProductionSystem(
             config=software_config,
-            resource_enum=self.resource_enum
+            resource_enum=self.resource_enum,
+            resource_cache=self._resource_cache
         )
 
     def create_storage_system(self,
@@ -472,10 +499,8 @@ class SubsystemFactory:
                               config: Optional[Dict] = None,
                               enabled: bool = True) -> DynamicStorageSystem:
         """Create dynamic storage system"""
-        # Merge spec config with provided config
-        storage_config = self.subsystem_data.get('storage', {})
-        if config:
-            storage_config.update(config)
+        # Merge spec config with provided config (without touching the spec)
+        storage_config = {**self.subsystem_data.get('storage', {}), **(config or {})}
 
         # Add spec resources to config if available
         if 'resources' in self.spec:
@@ -486,7 +511,8 @@ class SubsystemFactory:
             total_weight_capacity_tons=total_weight_capacity_tons,
             config=storage_config,
             resource_enum=self.resource_enum,
-            enabled=enabled
+            enabled=enabled,
+            resource_cache=self._resource_cache
         )
 
     def create_all_subsystems(self, factory_config: Dict) -> Dict:
@@ -78,22 +78,27 @@ def create_factory_from_spec(
     if spec.subsystem_implementations:
         logger.info(f"Configuring {len(spec.subsystem_implementations)} custom subsystems:")
 
-        # Clear default subsystems first if we're replacing them with spec-defined ones
-        factory.orchestrator.subsystems.clear()
+        # Drop default subsystems if we're replacing them with spec-defined ones;
+        # a fresh dict is cheaper than clearing and re-growing the old one
+        factory.orchestrator.subsystems = {}
+
+        available = frozenset(SubsystemRegistry.list_available())
+        sub_configs = {
+            role: SubsystemConfig(data)
+            for role, data in (spec.subsystem_data or {}).items()
+        }
 
         for role, impl_name in spec.subsystem_implementations.items():
             try:
                 # Check if implementation exists
-                if impl_name not in SubsystemRegistry.list_available():
+                if impl_name not in available:
                     raise SubsystemNotFoundError(impl_name, SubsystemRegistry.list_available())
 
                 # Create subsystem from registry
                 subsystem = SubsystemRegistry.create(impl_name)
 
                 # Get configuration for this subsystem if available
-                subsystem_config: Optional[SubsystemConfig] = None
-                if spec.subsystem_data and role in spec.subsystem_data:
-                    subsystem_config = SubsystemConfig(spec.subsystem_data[role])
+                subsystem_config: Optional[SubsystemConfig] = sub_configs.get(role)
 
                 # Add to factory
                 factory.add_custom_subsystem(role, subsystem, subsystem_config)
@@ -169,7 +174,7 @@ def validate_spec_subsystems(spec_path: str) -> bool:
     loader = SpecLoader()
     spec = loader.load_spec(spec_path)
 
-    available = SubsystemRegistry.list_available()
+    available = frozenset(SubsystemRegistry.list_available())
     all_valid: bool = True
 
     if spec.subsystem_implementations:
@@ -23,6 +23,9 @@ from self_replicating_factory_sim import (
     EnergySystem, Factory, CONFIG, ResourceType
 )
 
+# Name -> member map for resolving string resource keys in event payloads
+_RESOURCE_TYPES_BY_NAME = ResourceType.__members__
+
 
 # ===============================================================================
 # SUBSYSTEM WRAPPERS
@@ -46,7 +49,7 @@ class TransportSystemWrapper(SubsystemBase):
         self.transport_system = TransportSystem(transport_config)
 
         # Subscribe to transport requests
-        event_bus.subscribe(EventType.TRANSPORT_REQUESTED, self.handle_event)
+        event_bus.subscribe(EventType.TRANSPORT_REQUESTED, self._on_transport_requested)
 
     def update(self, delta_time: float, context: SimulationContext) -> Dict[str, Any]:
         if not self.enabled or not self.transport_system:
@@ -63,8 +66,8 @@ class TransportSystemWrapper(SubsystemBase):
         self.metrics["agv_utilization"] = self._calculate_agv_utilization()
 
         # Publish completion events
-        for job in completed_jobs:
-            self.publish_event(EventType.TRANSPORT_COMPLETED, {"job": job})
+        if completed_jobs:
+            self.publish_events(EventType.TRANSPORT_COMPLETED, [{"job": job} for job in completed_jobs])
 
         return {
             "completed_transports": len(completed_jobs),
@@ -81,16 +84,20 @@ class TransportSystemWrapper(SubsystemBase):
 
     def handle_event(self, event: Event):
         if event.type == EventType.TRANSPORT_REQUESTED:
-            # Schedule transport job
-            job = self.transport_system.schedule_transport(
-                from_module=event.data.get("from_module"),
-                to_module=event.data.get("to_module"),
-                resource=event.data.get("resource"),
-                quantity=event.data.get("quantity", 0),
-                distance=event.data.get("distance", 10)
-            )
-            if job:
-                self.publish_event(EventType.TRANSPORT_STARTED, {"job": job})
+            self._on_transport_requested(event)
+
+    def _on_transport_requested(self, event: Event):
+        """Schedule a transport job (subscribed to TRANSPORT_REQUESTED only)"""
+        data = event.data
+        job = self.transport_system.schedule_transport(
+            from_module=data.get("from_module"),
+            to_module=data.get("to_module"),
+            resource=data.get("resource"),
+            quantity=data.get("quantity", 0),
+            distance=data.get("distance", 10)
+        )
+        if job:
+            self.publish_event(EventType.TRANSPORT_STARTED, {"job": job})
 
 
 class WasteStreamWrapper(SubsystemBase):
@@ -104,31 +111,34 @@ class WasteStreamWrapper(SubsystemBase):
         super().initialize(config, event_bus)
         self.waste_stream = WasteStream()
         self.recycling_efficiency = config.get("recycling_efficiency", 0.75)
+        # The recyclable set is fixed per stream, so iterate a frozen copy
+        self._recycle_pairs = tuple(self.waste_stream.recyclable_materials.items())
 
         # Subscribe to waste generation events
-        event_bus.subscribe(EventType.TASK_COMPLETED, self.handle_event)
+        event_bus.subscribe(EventType.TASK_COMPLETED, self._on_task_completed)
 
     def update(self, delta_time: float, context: SimulationContext) -> Dict[str, Any]:
         if not self.enabled or not self.waste_stream:
             return {}
 
-        # Process recycling opportunities
+        # Process recycling opportunities, tallying what recyclable waste
+        # remains in the same pass
+        inventory = self.waste_stream.waste_inventory
         recycled_materials = {}
-        for resource_type, efficiency in self.waste_stream.recyclable_materials.items():
-            if resource_type in self.waste_stream.waste_inventory:
-                amount = self.waste_stream.waste_inventory[resource_type]
-                if amount > 0:
-                    recycled = self.waste_stream.process_recycling(resource_type, amount)
-                    if recycled > 0:
-                        recycled_materials[resource_type] = recycled
+        recyclable_waste = 0
+        for resource_type, efficiency in self._recycle_pairs:
+            amount = inventory.get(resource_type, 0)
+            if amount > 0:
+                recycled = self.waste_stream.process_recycling(resource_type, amount)
+                if recycled > 0:
+                    recycled_materials[resource_type] = recycled
+                amount = inventory[resource_type]
+            recyclable_waste += amount * efficiency
 
         # Update metrics
         total_waste = self.waste_stream.get_total_waste()
         self.metrics["total_waste"] = total_waste
-        self.metrics["recyclable_waste"] = sum(
-            self.waste_stream.waste_inventory.get(r, 0) * eff
-            for r, eff in self.waste_stream.recyclable_materials.items()
-        )
+        self.metrics["recyclable_waste"] = recyclable_waste
         self.metrics["recycled_this_update"] = sum(recycled_materials.values())
 
         return {
@@ -138,16 +148,19 @@ class WasteStreamWrapper(SubsystemBase):
 
     def handle_event(self, event: Event):
         if event.type == EventType.TASK_COMPLETED:
-            # Add waste from completed task
-            waste_data = event.data.get("waste", {})
-            for waste_type, quantity in waste_data.items():
-                if isinstance(waste_type, str):
-                    # Convert string to ResourceType if needed
-                    try:
-                        waste_type = ResourceType[waste_type]
-                    except KeyError:
-                        continue
-                self.waste_stream.add_waste(waste_type, quantity)
+            self._on_task_completed(event)
+
+    def _on_task_completed(self, event: Event):
+        """Add waste from a completed task (subscribed to TASK_COMPLETED only)"""
+        waste_data = event.data.get("waste", {})
+        add_waste = self.waste_stream.add_waste
+        for waste_type, quantity in waste_data.items():
+            if isinstance(waste_type, str):
+                # Convert string to ResourceType if needed
+                waste_type = _RESOURCE_TYPES_BY_NAME.get(waste_type)
+                if waste_type is None:
+                    continue
+            add_waste(waste_type, quantity)
 
 
 class ThermalSystemWrapper(SubsystemBase):
@@ -204,36 +217,45 @@ class SoftwareSystemWrapper(SubsystemBase):
     def __init__(self, name: str = "software"):
         super().__init__(name)
         self.software_system = None
+        # Software types still in development (insertion-ordered set), the
+        # types already developed, and a running reliability total over them
+        self._in_progress = {}
+        self._developed = set()
+        self._reliability_sum = 0.0
+        self._reliability_count = 0
 
     def initialize(self, config: SubsystemConfig, event_bus: EventBus):
         super().initialize(config, event_bus)
         self.software_system = SoftwareProductionSystem()
 
         # Subscribe to software development tasks
-        event_bus.subscribe(EventType.TASK_STARTED, self.handle_event)
+        event_bus.subscribe(EventType.TASK_STARTED, self._on_task_started)
 
     def update(self, delta_time: float, context: SimulationContext) -> Dict[str, Any]:
         if not self.enabled or not self.software_system:
             return {}
 
-        # Develop software packages
+        # Develop software packages. develop_software finishes a package in one
+        # call and files it under a versioned name, so a queued type is done
+        # as soon as it returns
         developed_packages = []
-        for package_name in list(self.software_system.development_hours.keys()):
-            if package_name not in self.software_system.software_library:
-                self.software_system.develop_software(package_name, delta_time)
-                if package_name in self.software_system.software_library:
-                    developed_packages.append(package_name)
+        software_system = self.software_system
+        for software_type in self._in_progress:
+            package = software_system.develop_software(software_type, delta_time)
+            developed_packages.append(f"{software_type.value}_{package['version']}")
+            self._developed.add(software_type)
+            self._reliability_sum += software_system.calculate_software_reliability(software_type)
+            self._reliability_count += 1
+        self._in_progress.clear()
 
         # Calculate overall reliability
         avg_reliability = 0
-        if self.software_system.software_library:
-            avg_reliability = sum(
-                pkg["reliability"] for pkg in self.software_system.software_library.values()
-            ) / len(self.software_system.software_library)
+        if self._reliability_count:
+            avg_reliability = self._reliability_sum / self._reliability_count
 
         # Update metrics
         self.metrics["total_packages"] = len(self.software_system.software_library)
-        self.metrics["packages_in_development"] = len(self.software_system.development_hours)
+        self.metrics["packages_in_development"] = len(self._in_progress)
         self.metrics["average_reliability"] = avg_reliability
         self.metrics["developed_this_update"] = len(developed_packages)
 
@@ -244,11 +266,15 @@ class SoftwareSystemWrapper(SubsystemBase):
 
     def handle_event(self, event: Event):
         if event.type == EventType.TASK_STARTED:
-            # Check if task requires software
-            software_required = event.data.get("software_required")
-            if software_required and software_required not in self.software_system.software_library:
-                # Start developing required software
-                self.software_system.development_hours[software_required] = 0
+            self._on_task_started(event)
+
+    def _on_task_started(self, event: Event):
+        """Start developing software a task needs (subscribed to TASK_STARTED only)"""
+        software_required = event.data.get("software_required")
+        if software_required and software_required not in self._developed:
+            # Start developing required software
+            self.software_system.development_hours[software_required] = 0
+            self._in_progress[software_required] = None
 
 
 class CleanroomWrapper(SubsystemBase):
@@ -267,9 +293,10 @@ class CleanroomWrapper(SubsystemBase):
         if not self.enabled:
             return {}
 
-        # Update all cleanrooms
+        # Update all cleanrooms, collecting contamination events as we go
         total_contamination = 0
         rooms_needing_cleaning = []
+        contamination_events = []
 
         for room_id, room in self.cleanrooms.items():
             room.update_contamination(delta_time)
@@ -279,6 +306,13 @@ class CleanroomWrapper(SubsystemBase):
                 rooms_needing_cleaning.append(room_id)
                 room.perform_cleaning()
 
+            if room.particle_count > room.cleanroom_class * 10:
+                contamination_events.append({
+                    "room_id": room_id,
+                    "particle_count": room.particle_count,
+                    "class": room.cleanroom_class
+                })
+
         # Update metrics
         self.metrics["total_cleanrooms"] = len(self.cleanrooms)
         self.metrics["average_contamination"] = (
@@ -287,13 +321,8 @@ class CleanroomWrapper(SubsystemBase):
         self.metrics["rooms_cleaned"] = len(rooms_needing_cleaning)
 
         # Publish contamination events
-        for room_id, room in self.cleanrooms.items():
-            if room.particle_count > room.cleanroom_class * 10:
-                self.publish_event(EventType.CONTAMINATION_DETECTED, {
-                    "room_id": room_id,
-                    "particle_count": room.particle_count,
-                    "class": room.cleanroom_class
-                })
+        if contamination_events:
+            self.publish_events(EventType.CONTAMINATION_DETECTED, contamination_events)
 
         return {
             "rooms_cleaned": len(rooms_needing_cleaning),
@@ -314,6 +343,7 @@ class StorageSystemWrapper(SubsystemBase):
     def __init__(self, name: str = "storage"):
         super().__init__(name)
         self.storage = defaultdict(float)
+        self._total_quantity = 0.0  # Running sum of storage values
         self.max_volume = 15000  # m³
         self.max_weight = 10000  # tons
 
@@ -323,16 +353,17 @@ class StorageSystemWrapper(SubsystemBase):
         self.max_weight = config.get("max_storage_weight_tons", 10000)
 
         # Subscribe to resource events
-        event_bus.subscribe(EventType.RESOURCE_PRODUCED, self.handle_event)
-        event_bus.subscribe(EventType.RESOURCE_CONSUMED, self.handle_event)
+        event_bus.subscribe(EventType.RESOURCE_PRODUCED, self._on_resource_produced)
+        event_bus.subscribe(EventType.RESOURCE_CONSUMED, self._on_resource_consumed)
 
     def update(self, delta_time: float, context: SimulationContext) -> Dict[str, Any]:
         if not self.enabled:
             return {}
 
         # Calculate current storage utilization
-        total_volume = sum(self.storage.values()) * 0.001  # Rough conversion
-        total_weight = sum(self.storage.values()) * 0.01   # Rough conversion
+        total_quantity = self._total_quantity
+        total_volume = total_quantity * 0.001  # Rough conversion
+        total_weight = total_quantity * 0.01   # Rough conversion
 
         volume_utilization = min(total_volume / self.max_volume, 1.0)
         weight_utilization = min(total_weight / self.max_weight, 1.0)
@@ -341,7 +372,7 @@ class StorageSystemWrapper(SubsystemBase):
         self.metrics["volume_utilization"] = volume_utilization
         self.metrics["weight_utilization"] = weight_utilization
         self.metrics["total_items_stored"] = len(self.storage)
-        self.metrics["total_quantity"] = sum(self.storage.values())
+        self.metrics["total_quantity"] = total_quantity
 
         # Check if storage is full
         if volume_utilization > 0.95 or weight_utilization > 0.95:
@@ -357,16 +388,28 @@ class StorageSystemWrapper(SubsystemBase):
 
     def handle_event(self, event: Event):
         if event.type == EventType.RESOURCE_PRODUCED:
-            resource = event.data.get("resource")
-            quantity = event.data.get("quantity", 0)
-            if resource:
-                self.storage[resource] += quantity
-
+            self._on_resource_produced(event)
         elif event.type == EventType.RESOURCE_CONSUMED:
-            resource = event.data.get("resource")
-            quantity = event.data.get("quantity", 0)
-            if resource and self.storage[resource] >= quantity:
-                self.storage[resource] -= quantity
+            self._on_resource_consumed(event)
+
+    def _on_resource_produced(self, event: Event):
+        """Store produced resources (subscribed to RESOURCE_PRODUCED only)"""
+        data = event.data
+        resource = data.get("resource")
+        quantity = data.get("quantity", 0)
+        if resource:
+            self.storage[resource] += quantity
+            self._total_quantity += quantity
+
+    def _on_resource_consumed(self, event: Event):
+        """Withdraw consumed resources if in stock (subscribed to RESOURCE_CONSUMED only)"""
+        data = event.data
+        resource = data.get("resource")
+        quantity = data.get("quantity", 0)
+        storage = self.storage
+        if resource and storage[resource] >= quantity:
+            storage[resource] -= quantity
+            self._total_quantity -= quantity
 
 
 class EnergySystemWrapper(SubsystemBase):
@@ -375,6 +418,8 @@ class EnergySystemWrapper(SubsystemBase):
     def __init__(self, name: str = "energy"):
         super().__init__(name)
         self.energy_system = None
+        # Last published battery state (True = depleted), None before first update
+        self._depleted = None
 
     def initialize(self, config: SubsystemConfig, event_bus: EventBus):
         super().initialize(config, event_bus)
@@ -414,17 +459,20 @@ class EnergySystemWrapper(SubsystemBase):
         )
         self.metrics["available_energy"] = available
 
-        # Publish energy status events
-        if self.metrics["battery_percentage"] < 0.1:
-            self.publish_event(EventType.ENERGY_DEPLETED, {
-                "battery_charge": self.energy_system.battery_charge_kwh,
-                "percentage": self.metrics["battery_percentage"]
-            })
-        else:
-            self.publish_event(EventType.ENERGY_AVAILABLE, {
-                "available": available,
-                "battery_percentage": self.metrics["battery_percentage"]
-            })
+        # Publish energy status events only when the battery crosses the threshold
+        depleted = self.metrics["battery_percentage"] < 0.1
+        if depleted != self._depleted:
+            self._depleted = depleted
+            if depleted:
+                self.publish_event(EventType.ENERGY_DEPLETED, {
+                    "battery_charge": self.energy_system.battery_charge_kwh,
+                    "percentage": self.metrics["battery_percentage"]
+                })
+            else:
+                self.publish_event(EventType.ENERGY_AVAILABLE, {
+                    "available": available,
+                    "battery_percentage": self.metrics["battery_percentage"]
+                })
 
         return {
             "energy_generated": generated,
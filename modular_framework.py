@@ -8,7 +8,7 @@ easily swapped, parallelized, and reconfigured without modifying core simulation
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Set, Callable, Type
+from typing import Dict, Any, List, Optional, Set, Callable, Type, Iterable
 from collections import defaultdict, deque
 from enum import Enum
 import json
@@ -49,6 +49,11 @@ class SimulationContext:
     tasks: List[Any] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def hour_of_day(self) -> float:
+        """Simulation clock time within the current 24-hour day"""
+        return self.time % 24
+
     def copy(self) -> 'SimulationContext':
         """Create an efficient copy of the context (shallow copy of immutable data)"""
         return SimulationContext(
@@ -156,30 +161,51 @@ class EventBus:
             self.event_queue.put_nowait(event)
             self.event_history.append(event)  # deque automatically maintains maxlen
         except Full:
-            self.dropped_events += 1
+            self._record_dropped_event(event)
+
+    def publish_batch(self, events: Iterable[Event]):
+        """
+        Publish several events in order.
 
-            # Import constant from self_replicating_factory_sim if available, else use default
+        Same semantics as calling publish() for each event, but the queue and
+        history are resolved once for the whole batch.
+        """
+        from queue import Full
+        put = self.event_queue.put_nowait
+        record = self.event_history.append
+        for event in events:
             try:
-                from self_replicating_factory_sim import EVENT_QUEUE_DROP_LOG_INTERVAL
-                log_interval = EVENT_QUEUE_DROP_LOG_INTERVAL
-            except ImportError:
-                log_interval = 100  # Default fallback
-
-            # Log at regular intervals
-            if self.dropped_events % log_interval == 1:
-                logger.warning(
-                    f"Event queue full (size={self.max_queue_size}), "
-                    f"dropped {self.dropped_events} events total. "
-                    f"Latest dropped: {event}"
-                )
+                put(event)
+                record(event)
+            except Full:
+                self._record_dropped_event(event)
 
-            # Raise exception if drop rate is critical (>10% of queue size)
-            if self.dropped_events > self.max_queue_size * 0.1:
-                from exceptions import EventQueueOverflowError
-                raise EventQueueOverflowError(
-                    self.event_queue.qsize(),
-                    self.max_queue_size
-                )
+    def _record_dropped_event(self, event: Event):
+        """Account for an event dropped because the queue is full"""
+        self.dropped_events += 1
+
+        # Import constant from self_replicating_factory_sim if available, else use default
+        try:
+            from self_replicating_factory_sim import EVENT_QUEUE_DROP_LOG_INTERVAL
+            log_interval = EVENT_QUEUE_DROP_LOG_INTERVAL
+        except ImportError:
+            log_interval = 100  # Default fallback
+
+        # Log at regular intervals
+        if self.dropped_events % log_interval == 1:
+            logger.warning(
+                f"Event queue full (size={self.max_queue_size}), "
+                f"dropped {self.dropped_events} events total. "
+                f"Latest dropped: {event}"
+            )
+
+        # Raise exception if drop rate is critical (>10% of queue size)
+        if self.dropped_events > self.max_queue_size * 0.1:
+            from exceptions import EventQueueOverflowError
+            raise EventQueueOverflowError(
+                self.event_queue.qsize(),
+                self.max_queue_size
+            )
 
     def process_events(self):
         """Process all queued events (thread-safe)"""
@@ -307,6 +333,13 @@ class SubsystemBase(ISubsystem):
             event = Event(type=event_type, source=self.name, data=data)
             self.event_bus.publish(event)
 
+    def publish_events(self, event_type: EventType, data_list: Iterable[Dict[str, Any]]):
+        """Helper to publish one event per data dict as a single batch"""
+        if self.event_bus:
+            self.event_bus.publish_batch(
+                Event(type=event_type, source=self.name, data=data) for data in data_list
+            )
+
     def get_metrics(self) -> Dict[str, Any]:
         """Return current metrics"""
         return self.metrics.copy()
@@ -1622,6 +1622,10 @@ class StorageSystem:
         self.current_inventory[resource] += quantity
         return True
 
+    def remove_resource(self, resource: ResourceType, quantity: float):
+        """Take resource out of storage (callers check availability first)"""
+        self.current_inventory[resource] -= quantity
+
 # ===============================================================================
 # TASK SYSTEM - ENHANCED
 # ===============================================================================
@@ -1676,7 +1680,7 @@ class Factory:
         except ValidationError as e:
             # Re-raise with clearer error message
             from exceptions import InvalidConfigurationError
-            errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
+            errors = [f"{err['loc'][-1]}: {err['msg']}" for err in e.errors()]
             raise InvalidConfigurationError(
                 "config",
                 config_dict,
@@ -2149,7 +2153,7 @@ class Factory:
         # Consume inputs
         for input_resource, input_qty in task.recipe.inputs.items():
             required = input_qty * task.quantity / task.recipe.output_quantity
-            self.storage.current_inventory[input_resource] -= required
+            self.storage.remove_resource(input_resource, required)
 
         # Consume energy
         self.energy_system.update_battery(
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for the simulation log analysis helpers in analyze_factory_sim.
+"""
+
+import json
+import math
+import pytest
+import analyze_factory_sim
+from analyze_factory_sim import load_simulation_data
+
+
+class TestLoadSimulationData:
+    """Test log loading across the parser backends"""
+
+    def _write_nan_log(self, tmp_path):
+        log_file = tmp_path / "factory_simulation_log.json"
+        log_file.write_text(
+            '{"final_status": {"efficiency": NaN, "peak": Infinity}, '
+            '"log_entries": [{"timestamp": 1.0, "message": "ok"}]}'
+        )
+        return log_file
+
+    def test_nan_log_below_stream_threshold(self, tmp_path):
+        """Test NaN/Infinity tokens load through the in-memory path"""
+        data = load_simulation_data(str(self._write_nan_log(tmp_path)))
+
+        assert math.isnan(data["final_status"]["efficiency"])
+        assert data["final_status"]["peak"] == float("inf")
+        assert data["log_entries"] == [{"timestamp": 1.0, "message": "ok"}]
+
+    def test_nan_log_above_stream_threshold(self, tmp_path, monkeypatch):
+        """Test NaN/Infinity tokens also load when the log is stream-parsed"""
+        if not analyze_factory_sim.IJSON_AVAILABLE:
+            pytest.skip("ijson not installed")
+        monkeypatch.setattr(analyze_factory_sim, "STREAM_PARSE_THRESHOLD_MB", 0)
+
+        data = load_simulation_data(str(self._write_nan_log(tmp_path)))
+
+        assert data is not None
+        assert math.isnan(data["final_status"]["efficiency"])
+        assert data["final_status"]["peak"] == float("inf")
+        assert data["log_entries"] == [{"timestamp": 1.0, "message": "ok"}]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing log returns None"""
+        assert load_simulation_data(str(tmp_path / "missing.json")) is None
+
+
+def _reference_log_scan(log_entries, module_names):
+    """The per-panel log scans build_log_index replaced, one loop per panel"""
+    failed_modules = set()
+    for entry in log_entries:
+        if 'FAILED' in entry.get('message', ''):
+            for module in module_names:
+                if module in entry['message'].lower():
+                    failed_modules.add(module)
+
+    blocking_reasons = {}
+    for entry in log_entries:
+        msg = entry.get('message', '')
+        if 'blocked' in msg.lower():
+            if 'energy' in msg.lower():
+                reason = 'Energy'
+            elif 'module' in msg.lower() or 'no ' in msg.lower():
+                reason = 'Module\nUnavailable'
+            elif 'resource' in msg.lower() or 'needs' in msg.lower():
+                reason = 'Missing\nResources'
+            elif 'dependencies' in msg.lower():
+                reason = 'Dependencies'
+            elif 'thermal' in msg.lower():
+                reason = 'Thermal'
+            elif 'storage' in msg.lower():
+                reason = 'Storage'
+            else:
+                reason = 'Other'
+            blocking_reasons[reason] = blocking_reasons.get(reason, 0) + 1
+
+    transport_events = {'scheduled': 0, 'completed': 0, 'agv_busy': 0}
+    for entry in log_entries:
+        msg = entry.get('message', '')
+        if 'transport' in msg.lower():
+            if 'scheduled' in msg.lower():
+                transport_events['scheduled'] += 1
+            elif 'completed' in msg.lower():
+                transport_events['completed'] += 1
+            elif 'agv' in msg.lower() and 'busy' in msg.lower():
+                transport_events['agv_busy'] += 1
+
+    critical_events = []
+    for entry in log_entries:
+        msg = entry.get('message', '')
+        time = entry.get('timestamp', 0) / 24
+        if 'FAILED' in msg:
+            critical_events.append(('FAILURE', time, msg[:50]))
+        elif 'blocked' in msg and len(critical_events) < 20:
+            if 'mining' in msg.lower():
+                critical_events.append(('BLOCK-MINING', time, 'Mining unavailable'))
+            elif 'energy' in msg.lower():
+                critical_events.append(('BLOCK-ENERGY', time, 'Energy shortage'))
+            elif 'module' in msg.lower():
+                critical_events.append(('BLOCK-MODULE', time, 'Module unavailable'))
+
+    bottlenecks = {}
+    for entry in log_entries:
+        if 'blocked' in entry.get('message', '').lower():
+            if 'mining' in entry['message'].lower():
+                reason = 'Mining Module'
+            elif 'energy' in entry['message'].lower():
+                reason = 'Energy'
+            elif 'module' in entry['message'].lower():
+                reason = 'Module Availability'
+            else:
+                continue
+            bottlenecks[reason] = bottlenecks.get(reason, 0) + 1
+
+    return failed_modules, blocking_reasons, transport_events, critical_events, bottlenecks
+
+
+class TestBuildLogIndex:
+    """Test the single-pass LogIndex against the per-panel scans it replaced"""
+
+    TOKENS = ['blocked', 'Blocked', 'BLOCKED', 'FAILED', 'failed', 'energy', 'mining',
+              'module', 'no ', 'resource', 'needs', 'dependencies', 'thermal', 'storage',
+              'transport', 'Transport', 'scheduled', 'completed', 'AGV', 'busy',
+              'cnc', 'laser', 'task_17', 'waiting']
+    MODULES = ('mining', 'cnc', 'laser', 'power')
+
+    def _random_log(self, seed, n=2000):
+        import random
+        rng = random.Random(seed)
+        entries = []
+        for i in range(n):
+            words = rng.sample(self.TOKENS, rng.randint(0, 5))
+            entry = {'timestamp': i * 0.5, 'message': ' '.join(words)}
+            if rng.random() < 0.02:
+                del entry['message']
+            entries.append(entry)
+        return entries
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_reference_scan(self, seed):
+        """Test every index field equals the old per-panel computation"""
+        entries = self._random_log(seed)
+        failed, blocking, transport, critical, bottlenecks = _reference_log_scan(
+            entries, self.MODULES)
+
+        index = analyze_factory_sim.build_log_index(entries, self.MODULES)
+
+        assert index.failed_modules == failed
+        assert list(index.blocking_counts.items()) == list(blocking.items())
+        assert index.transport_events == transport
+        assert index.critical_events == critical
+        assert list(index.bottleneck_counts.items()) == list(bottlenecks.items())
+
+    def test_empty_log(self):
+        """Test an empty log yields an empty index"""
+        index = analyze_factory_sim.build_log_index([], self.MODULES)
+
+        assert not index.blocking_counts
+        assert not index.bottleneck_counts
+        assert index.transport_events == {'scheduled': 0, 'completed': 0, 'agv_busy': 0}
+        assert index.failed_modules == set()
+        assert index.critical_events == []
+
+    def test_top_resources_match_sorted_totals(self):
+        """Test compute_top_resources matches a full stable sort of the totals"""
+        import random
+        rng = random.Random(5)
+        tasks = [{'output': f'res_{rng.randint(0, 40)}', 'actual_output': rng.randint(0, 5)}
+                 for _ in range(500)]
+        tasks.append({'output': 'quantity_only', 'quantity': 3})
+        totals = {}
+        for task in tasks:
+            output = task.get('output', 'unknown')
+            totals[output] = totals.get(output, 0) + task.get('actual_output', task.get('quantity', 0))
+        expected = sorted(totals.items(), key=lambda x: x[1], reverse=True)[:15]
+
+        assert analyze_factory_sim.compute_top_resources(tasks) == expected
+
+
+class TestIndexCache:
+    """Test the JSON index cache written next to the simulation log"""
+
+    def _write_log(self, tmp_path):
+        data = {
+            'final_status': {'modules': {'mining': 0, 'cnc': 2}},
+            'log_entries': [
+                {'timestamp': 12.0, 'message': 'mining module FAILED'},
+                {'timestamp': 24.0, 'message': 'task_3 blocked: needs energy'},
+                {'timestamp': 30.0, 'message': 'Transport scheduled for task_4'},
+            ],
+            'completed_tasks': [{'output': 'steel', 'actual_output': 4}],
+        }
+        log_file = tmp_path / "factory_simulation_log.json"
+        log_file.write_text(json.dumps(data))
+        return str(log_file), data
+
+    def test_cache_round_trip(self, tmp_path):
+        """Test a cache hit returns an index equal to a fresh build"""
+        log_file, data = self._write_log(tmp_path)
+
+        built = analyze_factory_sim.get_or_build_index(log_file, data)
+        assert (tmp_path / "factory_simulation_log.index.json").exists()
+        cached = analyze_factory_sim.get_or_build_index(log_file, {})
+
+        assert cached == built
+        assert list(cached.blocking_counts) == list(built.blocking_counts)
+
+    def test_format_version_change_rebuilds(self, tmp_path, monkeypatch):
+        """Test a cache written by another index format version is not reused"""
+        log_file, data = self._write_log(tmp_path)
+        analyze_factory_sim.get_or_build_index(log_file, data)
+
+        monkeypatch.setattr(analyze_factory_sim, "INDEX_FORMAT_VERSION",
+                            analyze_factory_sim.INDEX_FORMAT_VERSION + 1)
+        rebuilt = analyze_factory_sim.get_or_build_index(log_file, {})
+
+        assert rebuilt.critical_events == []
+        assert rebuilt.top_resources == []
+
+    def test_corrupt_cache_rebuilds(self, tmp_path):
+        """Test an unreadable cache file falls back to rebuilding"""
+        log_file, data = self._write_log(tmp_path)
+        (tmp_path / "factory_simulation_log.index.json").write_text("not json")
+
+        index = analyze_factory_sim.get_or_build_index(log_file, data)
+
+        assert index.failed_modules == {'mining'}
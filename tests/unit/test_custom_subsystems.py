@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the custom subsystem implementations in custom_subsystems.
+"""
+
+import random
+import statistics
+import pytest
+from modular_framework import Event, EventType, SubsystemConfig
+from custom_subsystems import (
+    GeneticRoutingTransport,
+    PredictiveMaintenanceSystem,
+    StatisticalProcessControl,
+)
+
+
+class TestGeneticRoutingTransportQueue:
+    """Test the bounded priority queue of pending transport requests"""
+
+    def _transport(self, event_bus, max_pending=1000):
+        transport = GeneticRoutingTransport()
+        transport.initialize(SubsystemConfig({"max_pending": max_pending}), event_bus)
+        return transport
+
+    def _request(self, event_bus, source, priority):
+        event_bus.publish(Event(EventType.TRANSPORT_REQUESTED, "test",
+                                {"from": source, "to": "assembly", "priority": priority}))
+
+    def _dispatch_order(self, transport, simulation_context):
+        transport.update(0.1, simulation_context)
+        return [t["from"] for t in transport.active_transports.values()]
+
+    def test_dispatch_in_priority_order(self, event_bus, simulation_context):
+        """Test higher priorities dispatch first, FIFO within a priority"""
+        transport = self._transport(event_bus)
+        for source, priority in [("a", 1), ("b", 5), ("c", 3), ("d", 5), ("e", 1)]:
+            self._request(event_bus, source, priority)
+        event_bus.process_events()
+
+        assert self._dispatch_order(transport, simulation_context) == ["b", "d", "c", "a", "e"]
+        assert transport.dropped_transports == 0
+
+    def test_full_queue_evicts_lowest_priority(self, event_bus, simulation_context):
+        """Test a higher-priority request displaces the lowest, newest queued one"""
+        transport = self._transport(event_bus, max_pending=3)
+        for source, priority in [("a", 1), ("b", 5), ("c", 1), ("d", 3)]:
+            self._request(event_bus, source, priority)
+        event_bus.process_events()
+
+        assert len(transport.pending_transports) == 3
+        assert transport.dropped_transports == 1
+        assert self._dispatch_order(transport, simulation_context) == ["b", "d", "a"]
+
+    def test_full_queue_rejects_lower_priority(self, event_bus, simulation_context):
+        """Test a request no better than the queued ones is itself dropped"""
+        transport = self._transport(event_bus, max_pending=2)
+        for source, priority in [("a", 2), ("b", 4), ("c", 2), ("d", 1)]:
+            self._request(event_bus, source, priority)
+        event_bus.process_events()
+
+        assert transport.dropped_transports == 2
+        assert self._dispatch_order(transport, simulation_context) == ["b", "a"]
+        assert transport.get_metrics()["dropped_transports"] == 2
+
+
+class TestStatisticalProcessControlWindow:
+    """Test the running (Welford) window statistics against a full recompute"""
+
+    def _assert_matches_window(self, chart):
+        values = list(chart["values"])
+        std = (chart["window_m2"] / len(values)) ** 0.5
+        assert chart["window_mean"] == pytest.approx(statistics.fmean(values), rel=1e-9, abs=1e-9)
+        assert std == pytest.approx(statistics.pstdev(values), rel=1e-6, abs=1e-9)
+
+    def test_running_stats_match_statistics(self):
+        """Test mean/std track statistics before and after the window evicts samples"""
+        spc = StatisticalProcessControl()
+        chart = spc.control_charts["cycle_time"]
+        window = chart["values"].maxlen
+        rng = random.Random(7)
+
+        for i in range(window * 4):
+            spc._add_sample(chart, rng.gauss(10.0, 2.0) + (i // window) * 5.0)
+            self._assert_matches_window(chart)
+
+        assert len(chart["values"]) == window
+
+    def test_update_sets_limits_from_window(self, event_bus, simulation_context):
+        """Test update() derives control limits from the current window only"""
+        spc = StatisticalProcessControl()
+        spc.initialize(SubsystemConfig({"min_samples_for_limits": 5}), event_bus)
+        window = spc.control_charts["defect_rate"]["values"].maxlen
+        samples = [float(i % 7) for i in range(window + 30)]
+        for value in samples:
+            event_bus.publish(Event(EventType.TASK_COMPLETED, "test", {"defect_rate": value}))
+        event_bus.process_events()
+
+        spc.update(0.1, simulation_context)
+
+        chart = spc.control_charts["defect_rate"]
+        recent = samples[-window:]
+        assert chart["mean"] == pytest.approx(statistics.fmean(recent))
+        assert chart["std"] == pytest.approx(statistics.pstdev(recent))
+        assert chart["ucl"] == pytest.approx(statistics.fmean(recent) + 3 * statistics.pstdev(recent))
+
+
+class TestPredictiveMaintenanceDegradation:
+    """Test the degradation rate factors"""
+
+    @pytest.mark.parametrize("temperature,factor", [
+        (50, 1.0),
+        (60, 1.0),
+        (70, 1.5),
+        (80, 1.5),
+        (90, 2.0),
+    ])
+    def test_temperature_factor(self, temperature, factor):
+        """Test the temperature factor steps from 1.0 to 1.5 above 60 and 2.0 above 80"""
+        maintenance = PredictiveMaintenanceSystem()
+        rate = maintenance._get_degradation_rate("cnc", {"temperature": temperature})
+
+        assert rate == pytest.approx(0.001 * factor)
+
+    def test_no_temperature_reading(self):
+        """Test modules without a temperature use the base rate"""
+        maintenance = PredictiveMaintenanceSystem()
+
+        assert maintenance._get_degradation_rate("cnc", {}) == pytest.approx(0.001)
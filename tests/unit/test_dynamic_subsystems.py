@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the spec-driven subsystems in dynamic_subsystems.
+"""
+
+import random
+import pytest
+from self_replicating_factory_sim import ResourceType
+from dynamic_subsystems import DynamicStorageSystem, DynamicWasteStream
+
+
+def _rescanned_totals(storage):
+    """Volume and weight computed from current_inventory the way the old code did"""
+    volume = sum(
+        qty / storage.get_material_properties(res)[0]
+        for res, qty in storage.current_inventory.items()
+    )
+    weight = sum(storage.current_inventory.values())
+    return volume, weight
+
+
+class TestDynamicStorageTotals:
+    """Test the running volume/weight totals against a full inventory rescan"""
+
+    def _storage(self, **kwargs):
+        config = {'material_properties': {
+            'IRON_ORE': {'density': 4.0},
+            'SILICON_WAFER': (2.3, 22, 1.0),
+            'ORGANIC_SOLVENT': {'density': 0.8},
+        }}
+        return DynamicStorageSystem(1e9, 1e9, config=config, resource_enum=ResourceType, **kwargs)
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_totals_match_rescan(self, enabled):
+        """Test totals track every add/remove exactly like recomputing them"""
+        storage = self._storage(enabled=enabled)
+        resources = [ResourceType.IRON_ORE, ResourceType.SILICON_WAFER,
+                     ResourceType.ORGANIC_SOLVENT, ResourceType.STEEL]
+        rng = random.Random(11)
+
+        for _ in range(500):
+            resource = rng.choice(resources)
+            available = storage.get_available(resource)
+            if available > 0 and rng.random() < 0.4:
+                storage.remove_resource(resource, rng.uniform(0, available))
+            else:
+                assert storage.add_resource(resource, rng.uniform(0, 50))
+
+            volume, weight = _rescanned_totals(storage)
+            utilization = storage.get_storage_utilization()
+            assert utilization["current_volume_m3"] == pytest.approx(volume, abs=1e-6)
+            assert utilization["current_weight_tons"] == pytest.approx(weight, abs=1e-6)
+
+    def test_can_store_uses_current_totals(self):
+        """Test capacity checks see removals as well as additions"""
+        storage = DynamicStorageSystem(10.0, 1e9, resource_enum=ResourceType)
+
+        assert storage.add_resource(ResourceType.STEEL, 8.0)
+        assert storage.can_store(ResourceType.STEEL, 5.0)[0] is False
+        assert storage.add_resource(ResourceType.STEEL, 5.0) is False
+
+        storage.remove_resource(ResourceType.STEEL, 4.0)
+        assert storage.can_store(ResourceType.STEEL, 5.0) == (True, "OK")
+        assert storage.get_storage_utilization()["current_weight_tons"] == pytest.approx(4.0)
+
+
+class TestDynamicWasteTotal:
+    """Test the running waste total against summing waste_inventory"""
+
+    def test_total_matches_inventory_sum(self):
+        """Test get_total_waste follows add_waste and process_recycling"""
+        waste = DynamicWasteStream(resource_enum=ResourceType)
+        waste_types = [ResourceType.STEEL, ResourceType.SILICON_WAFER, ResourceType.IRON_ORE]
+        rng = random.Random(3)
+
+        for _ in range(500):
+            waste_type = rng.choice(waste_types)
+            if rng.random() < 0.4:
+                # Over-asking is clamped to what is in the inventory
+                waste.process_recycling(waste_type, rng.uniform(0, 80))
+            else:
+                waste.add_waste(waste_type, rng.uniform(0, 50))
+
+            assert waste.get_total_waste() == pytest.approx(
+                sum(waste.waste_inventory.values()), abs=1e-6)
+
+    def test_non_recyclable_waste_stays_in_total(self):
+        """Test recycling an unrecognised waste type leaves the total unchanged"""
+        waste = DynamicWasteStream(resource_enum=ResourceType)
+        waste.add_waste(ResourceType.IRON_ORE, 12.0)
+
+        assert waste.process_recycling(ResourceType.IRON_ORE, 12.0) == 0.0
+        assert waste.get_total_waste() == pytest.approx(12.0)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the subsystem wrappers in modular_factory_adapter.
+"""
+
+import random
+import pytest
+from modular_framework import Event, EventType, SubsystemConfig
+from modular_factory_adapter import (
+    EnergySystemWrapper,
+    SoftwareSystemWrapper,
+    StorageSystemWrapper,
+)
+from self_replicating_factory_sim import ResourceType
+
+
+class TestStorageSystemWrapperTotals:
+    """Test the running stored-quantity total against re-summing storage"""
+
+    def test_total_matches_storage_sum(self, event_bus, simulation_context):
+        """Test metrics follow produce/consume events exactly like re-summing"""
+        storage = StorageSystemWrapper()
+        storage.initialize(SubsystemConfig({"max_storage_volume_m3": 50}), event_bus)
+        resources = ["steel", "copper_wire", "silicon_wafer"]
+        rng = random.Random(9)
+
+        for _ in range(300):
+            event_type = (EventType.RESOURCE_CONSUMED if rng.random() < 0.4
+                          else EventType.RESOURCE_PRODUCED)
+            # Consumes larger than the stock on hand are ignored
+            event_bus.publish(Event(event_type, "test", {
+                "resource": rng.choice(resources), "quantity": rng.uniform(0, 400)}))
+            event_bus.process_events()
+            storage.update(0.1, simulation_context)
+
+            expected = sum(storage.storage.values())
+            metrics = storage.get_metrics()
+            assert metrics["total_quantity"] == pytest.approx(expected, abs=1e-6)
+            assert metrics["volume_utilization"] == pytest.approx(
+                min(expected * 0.001 / 50, 1.0), abs=1e-9)
+            assert metrics["weight_utilization"] == pytest.approx(
+                min(expected * 0.01 / 10000, 1.0), abs=1e-9)
+
+
+class _ScriptedEnergySystem:
+    """Minimal energy system whose battery level the test sets directly"""
+
+    def __init__(self, capacity_kwh=1000.0):
+        self.battery_capacity_kwh = capacity_kwh
+        self.battery_charge_kwh = capacity_kwh / 2
+
+    def generate_solar_energy(self, time, delta_time):
+        return 0.0
+
+    def get_available_energy(self, delta_time):
+        return self.battery_charge_kwh
+
+
+class TestEnergySystemWrapperEvents:
+    """Test energy status events fire only when the battery crosses 10%"""
+
+    def _wrapper(self, event_bus):
+        wrapper = EnergySystemWrapper()
+        wrapper.initialize(SubsystemConfig(), event_bus)
+        wrapper.energy_system = _ScriptedEnergySystem()
+        return wrapper
+
+    def _run(self, wrapper, event_bus, simulation_context, charges):
+        """Update once per battery charge and return the status events published"""
+        events = []
+        event_bus.subscribe(EventType.ENERGY_DEPLETED, lambda e: events.append(e.type))
+        event_bus.subscribe(EventType.ENERGY_AVAILABLE, lambda e: events.append(e.type))
+        for charge in charges:
+            wrapper.energy_system.battery_charge_kwh = charge
+            wrapper.update(0.1, simulation_context)
+            event_bus.process_events()
+        return events
+
+    def test_steady_state_publishes_once(self, event_bus, simulation_context):
+        """Test staying above the threshold only reports the initial state"""
+        wrapper = self._wrapper(event_bus)
+
+        events = self._run(wrapper, event_bus, simulation_context, [500, 450, 300, 150, 900])
+
+        assert events == [EventType.ENERGY_AVAILABLE]
+
+    def test_each_crossing_publishes_once(self, event_bus, simulation_context):
+        """Test every threshold crossing emits exactly one event"""
+        wrapper = self._wrapper(event_bus)
+
+        events = self._run(wrapper, event_bus, simulation_context,
+                           [500, 50, 40, 20, 99, 100, 300, 10, 5])
+
+        assert events == [EventType.ENERGY_AVAILABLE, EventType.ENERGY_DEPLETED,
+                          EventType.ENERGY_AVAILABLE, EventType.ENERGY_DEPLETED]
+
+
+class TestSoftwareSystemWrapper:
+    """Test software requested by started tasks is developed exactly once"""
+
+    def _start_task(self, event_bus, software_type):
+        event_bus.publish(Event(EventType.TASK_STARTED, "test",
+                                {"task_id": "t1", "software_required": software_type}))
+        event_bus.process_events()
+
+    def test_requested_software_completes(self, event_bus, simulation_context):
+        """Test a TASK_STARTED request drains and adds one library entry"""
+        wrapper = SoftwareSystemWrapper()
+        wrapper.initialize(SubsystemConfig(), event_bus)
+        library = wrapper.software_system.software_library
+
+        self._start_task(event_bus, ResourceType.PLC_PROGRAM)
+        assert list(wrapper._in_progress) == [ResourceType.PLC_PROGRAM]
+
+        result = wrapper.update(0.1, simulation_context)
+        for _ in range(5):
+            wrapper.update(0.1, simulation_context)
+
+        assert wrapper._in_progress == {}
+        assert len(library) == 1
+        assert result["developed_packages"] == list(library)
+        assert 0 < wrapper.get_metrics()["average_reliability"] <= 1.0
+        assert wrapper.get_metrics()["packages_in_development"] == 0
+
+    def test_developed_software_is_not_restarted(self, event_bus, simulation_context):
+        """Test later tasks needing the same software do not redevelop it"""
+        wrapper = SoftwareSystemWrapper()
+        wrapper.initialize(SubsystemConfig(), event_bus)
+
+        self._start_task(event_bus, ResourceType.ROBOT_FIRMWARE)
+        wrapper.update(0.1, simulation_context)
+        self._start_task(event_bus, ResourceType.ROBOT_FIRMWARE)
+        result = wrapper.update(0.1, simulation_context)
+
+        assert result["developed_packages"] == []
+        assert len(wrapper.software_system.software_library) == 1
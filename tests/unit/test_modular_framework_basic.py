@@ -199,6 +199,22 @@ class TestEventBus:
         assert len(history) == 2
         assert all(e.source == "factory_a" for e in history)
 
+    def test_publish_batch(self):
+        """Test that a batch is delivered and recorded in order"""
+        bus = EventBus()
+        received = []
+
+        bus.subscribe(EventType.CONTAMINATION_DETECTED, received.append)
+
+        bus.publish_batch(
+            Event(type=EventType.CONTAMINATION_DETECTED, source="room", data={"index": i})
+            for i in range(3)
+        )
+        bus.process_events()
+
+        assert [e.data["index"] for e in received] == [0, 1, 2]
+        assert len(bus.get_history()) == 3
+
 
 class TestSubsystemConfig:
     """Test SubsystemConfig class"""